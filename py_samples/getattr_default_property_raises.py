@@ -0,0 +1,14 @@
+class C:
+    @property
+    def p(self):
+        raise AttributeError('p')
+
+
+def main():
+    c = C()
+    assert getattr(c, 'p', 42) == 42
+    assert getattr(c, 'q', 64) == 64
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+class Foo:
+    def m(self):
+        return 'class'
+
+
+def replacement(self):
+    return 'replaced'
+
+
+def main():
+    f = Foo()
+    results = []
+    for i in range(6):
+        if i == 2:
+            f.m = lambda: 'instance'
+        if i == 3:
+            del f.__dict__['m']
+        if i == 4:
+            Foo.m = replacement
+        results.append(f.m())
+    assert results == ['class', 'class', 'instance', 'class', 'replaced',
+                       'replaced'], results
+
+
+if __name__ == '__main__':
+    main()
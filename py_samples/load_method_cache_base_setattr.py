@@ -0,0 +1,29 @@
+class Base:
+    def m(self):
+        return 'base'
+
+
+class Middle(Base):
+    pass
+
+
+class Derived(Middle):
+    pass
+
+
+def replacement(self):
+    return 'middle'
+
+
+def main():
+    d = Derived()
+    results = []
+    for i in range(4):
+        if i == 2:
+            Middle.m = replacement
+        results.append(d.m())
+    assert results == ['base', 'base', 'middle', 'middle'], results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+class Base:
+    def f(self):
+        return 'base'
+
+
+class Middle(Base):
+    pass
+
+
+class Derived(Middle):
+    def f(self):
+        return super().f()
+
+
+def middle_f(self):
+    return 'middle'
+
+
+def main():
+    d = Derived()
+    assert d.f() == 'base'
+    assert d.f() == 'base'
+    Middle.f = middle_f
+    assert d.f() == 'middle'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,15 @@
+import sys
+
+
+def main():
+    try:
+        raise ValueError
+    except ValueError:
+        tb = sys.exc_info()[2]
+        assert tb.tb_frame is not None
+        assert tb.tb_lineno > 0
+        assert isinstance(tb.tb_lasti, int)
+
+
+if __name__ == '__main__':
+    main()
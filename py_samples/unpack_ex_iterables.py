@@ -0,0 +1,19 @@
+def gen():
+    yield 1
+    yield 2
+    yield 3
+
+
+def main():
+    a, *b = [1, 2, 3]
+    assert a == 1 and b == [2, 3], (a, b)
+    a, *b = gen()
+    assert a == 1 and b == [2, 3], (a, b)
+    a, b, c, *d = gen()
+    assert (a, b, c, d) == (1, 2, 3, []), (a, b, c, d)
+    a, *b = 'x'
+    assert a == 'x' and b == [], (a, b)
+
+
+if __name__ == '__main__':
+    main()
@@ -45,19 +45,27 @@ def _make_fpop_n(fpop: Callable[[], Node]) -> Callable[[int], List[Node]]:
     return fpop_n
 
 
+def do_MAKE_FUNCTION_36(fpop: Callable[[], Node],
+                        arg: int) -> MakeFunctionData:
+    """MAKE_FUNCTION for 3.6+, for callers that resolve the version once."""
+    qualified_name = fpop()
+    code = fpop()
+    freevar_cells = fpop() if arg & 0x08 else None
+    annotation_dict = fpop() if arg & 0x04 else None
+    kwarg_defaults = fpop() if arg & 0x02 else None
+    positional_defaults = fpop() if arg & 0x01 else None
+    if annotation_dict:
+        # TODO(cdleary): 2019-10-26 We just ignore this for now.
+        # raise NotImplementedError(annotation_dict)
+        pass
+    return MakeFunctionData(qualified_name, code, positional_defaults,
+                            kwarg_defaults, freevar_cells)
+
+
 def do_MAKE_FUNCTION(fpop: Callable[[], Node], arg: int,
                      version_info: VersionInfo) -> MakeFunctionData:
     if version_info >= (3, 6):
-        qualified_name = fpop()
-        code = fpop()
-        freevar_cells = fpop() if arg & 0x08 else None
-        annotation_dict = fpop() if arg & 0x04 else None
-        kwarg_defaults = fpop() if arg & 0x02 else None
-        positional_defaults = fpop() if arg & 0x01 else None
-        if annotation_dict:
-            # TODO(cdleary): 2019-10-26 We just ignore this for now.
-            # raise NotImplementedError(annotation_dict)
-            pass
+        return do_MAKE_FUNCTION_36(fpop, arg)
     else:
         # 3.5 documentation:
         # https://docs.python.org/3.5/library/dis.html#opcode-MAKE_FUNCTION
@@ -72,7 +80,7 @@ def do_MAKE_FUNCTION(fpop: Callable[[], Node], arg: int,
         kwarg_default_items = fpop_n(2 * name_and_default_pairs)
         kwarg_defaults = tuple(zip(kwarg_default_items[::2],
                                    kwarg_default_items[1::2]))
-        positional_defaults = fpop_n(default_argc)
+        positional_defaults = tuple(fpop_n(default_argc))
         freevar_cells = None
 
     return MakeFunctionData(qualified_name, code, positional_defaults,
@@ -1,7 +1,7 @@
 import itertools
 import types
 import weakref
-from typing import Text, Tuple, Any, Dict, Optional, Type
+from typing import Text, Tuple, Any, Dict, Optional, Type, FrozenSet
 from collections import OrderedDict as odict
 
 from echo.epy_object import EPyObject, AttrWhere, EPyType, try_invoke
@@ -20,6 +20,9 @@ _ITER_BUILTIN_TYPES: Tuple[Type, ...] = (
     type(weakref.WeakSet()), type(dict()),
     type(itertools.permutations(())),
 )
+# Exact-type lookup for the common case; subclasses of the above (e.g.
+# OrderedDict) still go through the isinstance check.
+_ITER_BUILTIN_TYPESET: FrozenSet[Type] = frozenset(_ITER_BUILTIN_TYPES)
 
 
 class SeqIterType(EPyType):
@@ -115,7 +118,8 @@ def _do_iter(args: Tuple[Any, ...],
              ictx: ICtx) -> Result[Any]:
     assert len(args) == 1
 
-    if isinstance(args[0], _ITER_BUILTIN_TYPES):
+    if (type(args[0]) in _ITER_BUILTIN_TYPESET
+            or isinstance(args[0], _ITER_BUILTIN_TYPES)):
         return Result(iter(args[0]))
 
     if isinstance(args[0], EPyObject) and args[0].hasattr('__iter__'):
@@ -157,6 +161,7 @@ BUILTIN_ITERATORS: Tuple[Type, ...] = (
     types.GeneratorType,
     type(itertools.permutations(())),
 )
+BUILTIN_ITERATORS_SET: FrozenSet[Type] = frozenset(BUILTIN_ITERATORS)
 
 
 @register_builtin('next')
@@ -165,7 +170,7 @@ def _do_next(args: Tuple[Any, ...],
              kwargs: Dict[Text, Any], ictx: ICtx) -> Result[Any]:
     assert len(args) == 1, args
     g = args[0]
-    if isinstance(g, BUILTIN_ITERATORS):
+    if type(g) in BUILTIN_ITERATORS_SET or isinstance(g, BUILTIN_ITERATORS):
         try:
             return Result(next(g))
         except StopIteration as e:
@@ -91,8 +91,11 @@ def _do_object_setattr(
     assert not kwargs
     o, name, value = args
     log('eo:object_setattr', f'o {o} name {name} value {value}')
-    if isinstance(o, (EInstance, EClass)):
+    if isinstance(o, EInstance):
         o.dict_[name] = value
+    elif isinstance(o, EClass):
+        o.dict_[name] = value
+        o.note_dict_mutation()
     else:
         raise NotImplementedError
     return Result(None)
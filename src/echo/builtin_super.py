@@ -1,3 +1,4 @@
+import weakref
 from typing import Text, Tuple, Any, Dict, Optional, Union
 
 from echo.elog import log
@@ -9,6 +10,17 @@ from echo.eobjects import (
 from echo.interp_context import ICtx
 
 
+# Remembers which class in a super object's MRO tail provides an attribute:
+# {start_type: {(type_, name): (EClass.dict_epoch, owner)}}, where an owner of
+# None records that no class in the tail provides the attribute.
+_SUPER_LOOKUP_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Attributes answered by the super object itself rather than the MRO tail.
+_SUPER_SPECIAL_NAMES = frozenset((
+    '__thisclass__', '__self_class__', '__self__', '__class__',
+))
+
+
 def _get_mro(o: EPyObject) -> Tuple[Union[EPyObject, type], ...]:
     if isinstance(o, EBuiltin):
         return o.get_mro()
@@ -17,10 +29,24 @@ def _get_mro(o: EPyObject) -> Tuple[Union[EPyObject, type], ...]:
 
 
 class ESuper(EPyObject):
+    __slots__ = ('type_', 'obj_or_type', 'obj_or_type_type', '_mro_tail',
+                 '__weakref__')
+
+    _mro_tail: Optional[Tuple[Union[EPyObject, type], ...]]
+
     def __init__(self, type_, obj_or_type, obj_or_type_type):
         self.type_ = type_
         self.obj_or_type = obj_or_type
         self.obj_or_type_type = obj_or_type_type
+        self._mro_tail = None
+
+    def _get_mro_tail(self) -> Tuple[Union[EPyObject, type], ...]:
+        """Returns everything succeeding 'type_' in the start type's MRO."""
+        if self._mro_tail is None:
+            mro = _get_mro(self.obj_or_type_type)
+            i = mro.index(self.type_)
+            self._mro_tail = mro[i+1:]
+        return self._mro_tail
 
     def has_standard_getattr(self) -> bool:
         return False
@@ -36,65 +62,68 @@ class ESuper(EPyObject):
         return "<esuper: <class '{}'>, <{} object>>".format(
             self.type_.name, self.obj_or_type_type.name)
 
-    def hasattr_where(self, name: Text) -> Optional[AttrWhere]:
-        if name in ('__thisclass__', '__self_class__', '__self__',
-                    '__class__'):
-            return AttrWhere.SELF_SPECIAL
-
+    def _find_owner(self, name: Text) -> Optional[EPyObject]:
+        """Returns the first class in the MRO tail that provides 'name'."""
         start_type = self.obj_or_type_type
-        mro = _get_mro(start_type)
-        # Look at everything succeeding 'type_' in the MRO order.
-        i = mro.index(self.type_)
-        mro = mro[i+1:]
-
-        for t in mro:
-            if isinstance(t, EBuiltin) and t.hasattr(name):
-                return AttrWhere.CLS
-            assert isinstance(t, EClass), t
+        type_cache = _SUPER_LOOKUP_CACHE.get(start_type)
+        if type_cache is None:
+            type_cache = _SUPER_LOOKUP_CACHE[start_type] = {}
+        key = (self.type_, name)
+        entry = type_cache.get(key)
+        if entry is not None and entry[0] == EClass.dict_epoch:
+            return entry[1]
+
+        owner: Optional[EPyObject] = None
+        for t in self._get_mro_tail():
+            if isinstance(t, EBuiltin):
+                if t.hasattr_where(name) is not None:
+                    owner = t
+                    break
+                continue
+            assert isinstance(t, EClass), (t, name)
             if name in t.dict_:
-                return AttrWhere.SELF_SPECIAL
+                owner = t
+                break
+
+        type_cache[key] = (EClass.dict_epoch, owner)
+        return owner
+
+    def hasattr_where(self, name: Text) -> Optional[AttrWhere]:
+        if name in _SUPER_SPECIAL_NAMES:
+            return AttrWhere.SELF_SPECIAL
 
-        return None
+        owner = self._find_owner(name)
+        if owner is None:
+            return None
+        if isinstance(owner, EBuiltin):
+            return AttrWhere.CLS
+        return AttrWhere.SELF_SPECIAL
 
     @check_result
     def getattr(self, name: Text, ictx: ICtx) -> Result[Any]:
-        if name == '__thisclass__':  # AKA su->type
-            return Result(self.type_)
-        if name == '__self_class__':  # AKA su->obj_type
-            return Result(self.obj_or_type_type)
-        if name == '__self__':  # AKA su->obj
-            return Result(self.obj_or_type)
-        if name == '__class__':
+        if name in _SUPER_SPECIAL_NAMES:
+            if name == '__thisclass__':  # AKA su->type
+                return Result(self.type_)
+            if name == '__self_class__':  # AKA su->obj_type
+                return Result(self.obj_or_type_type)
+            if name == '__self__':  # AKA su->obj
+                return Result(self.obj_or_type)
             return Result(get_guest_builtin('super'))
 
         start_type = self.obj_or_type_type
-        mro = _get_mro(start_type)
-        # Look at everything succeeding 'type_' in the MRO order.
-        i = mro.index(self.type_)
-        mro = mro[i+1:]
-
-        log('super:ga',
-            f'self.type_ {self.type_} start_type {start_type} mro {mro}')
-
-        for t in mro:
-            if isinstance(t, EBuiltin):
-                if t.hasattr(name):
-                    cls_attr = t.getattr(name, ictx)
-                else:
-                    continue
-            else:
-                assert isinstance(t, EClass), (t, name)
-                if name not in t.dict_:
-                    continue
-                # Name is in this class within the MRO, grab the attr.
-                cls_attr = t.getattr(name, ictx)
+        t = self._find_owner(name)
+        log('super:ga', lambda: f'self.type_ {self.type_} '
+                                f'start_type {start_type} owner {t}')
 
+        if t is not None:
+            # Name is in this class within the MRO, grab the attr.
+            cls_attr = t.getattr(name, ictx)
             if cls_attr.is_exception():
                 return Result(cls_attr.get_exception())
 
             cls_attr_value = cls_attr.get_value()
-            log('super:ga', f't: {t} cls_attr: {cls_attr_value}')
-            if cls_attr_value.hasattr_where('__get__') == AttrWhere.CLS:
+            log('super:ga', lambda: f't: {t} cls_attr: {cls_attr_value}')
+            if cls_attr_value.hasattr_where('__get__') is AttrWhere.CLS:
                 fget = cls_attr_value.getattr('__get__', ictx)
                 if fget.is_exception():
                     return fget
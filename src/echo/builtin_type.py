@@ -1,7 +1,7 @@
 from typing import Text, Tuple, Any, Dict
 
 from echo.elog import log
-from echo.epy_object import EPyObject
+from echo.epy_object import is_epy_object
 from echo.interp_result import Result, ExceptionData, check_result
 from echo.eobjects import EClass, register_builtin, get_guest_builtin
 from echo.interp_context import ICtx
@@ -106,7 +106,7 @@ def _do_type(args: Tuple[Any, ...], kwargs: Dict[Text, Any],
     assert isinstance(args, tuple), args
     log('go:type()', lambda: f'args: {args}')
     if len(args) == 1:
-        if isinstance(args[0], EPyObject):
+        if is_epy_object(args[0]):
             return Result(args[0].get_type())
         res = type(args[0])
         return Result(TYPE_TO_EBUILTIN.get(res, res))
@@ -10,6 +10,9 @@ from echo.enative_fn import ENativeFn
 from echo.interp_context import ICtx
 
 
+_TYPE_BUILTIN = get_guest_builtin('type')
+
+
 class EClassMethod(EPyObject):
     def __init__(self, f: EPyObject):
         self.f = f
@@ -43,8 +46,7 @@ class EClassMethod(EPyObject):
         _self, obj, objtype = args
         assert _self is self
         if obj is not None:
-            do_type = get_guest_builtin('type')
-            objtype = do_type.invoke((obj,), {}, {}, ictx).get_value()
+            objtype = _TYPE_BUILTIN.invoke((obj,), {}, {}, ictx).get_value()
         return Result(EMethod(self.f, bound_self=objtype))
 
     @check_result
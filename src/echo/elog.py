@@ -4,9 +4,17 @@ import sys
 from typing import Text, Callable, Union
 
 
+# Read once at import rather than per `log` call -- `log` sits on the
+# interpreter's per-bytecode paths. Callers that change the environment at
+# runtime call `reload_from_env` afterwards.
 ECHO_DEBUG = os.getenv('ECHO_DEBUG', '')
 
 
+def reload_from_env() -> None:
+    global ECHO_DEBUG
+    ECHO_DEBUG = os.getenv('ECHO_DEBUG', '')
+
+
 def _accepts(channel: Text) -> bool:
     if not ECHO_DEBUG:
         return False
@@ -17,7 +25,6 @@ def _accepts(channel: Text) -> bool:
 
 
 def log(channel: Text, s: Union[Text, Callable[[], Text]]) -> None:
-    ECHO_DEBUG = os.getenv('ECHO_DEBUG', '')
     if not ECHO_DEBUG:
         return
     if not _accepts(channel):
@@ -32,6 +39,8 @@ def debugged(channel: Text,
     def do_debug(f: Callable) -> Callable:
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
+            if not ECHO_DEBUG or not _accepts(channel):
+                return f(*args, **kwargs)
             args_str = ', '.join(repr(a) for a in args)
             kwargs_str = '' if not kwargs else ', '.join(
                 '{}={!r}'.format(k, v) for k, v in kwargs.items())
@@ -9,6 +9,10 @@ from echo.interp_context import ICtx
 from echo.elog import log
 
 
+_NEXT_BUILTIN = get_guest_builtin('next')
+_ITER_BUILTIN = get_guest_builtin('iter')
+
+
 class EMap(EPyObject):
     def __init__(self, f: EFunction, it):
         log('emap:new', f'f: {f} it: {it}')
@@ -35,8 +39,7 @@ class EMap(EPyObject):
         return Result(self)
 
     def next(self, ictx: ICtx) -> Result[Any]:
-        do_next = get_guest_builtin('next')
-        res = do_next.invoke((self.it,), {}, {}, ictx)
+        res = _NEXT_BUILTIN.invoke((self.it,), {}, {}, ictx)
         if res.is_exception():
             return res
         v = res.get_value()
@@ -52,8 +55,7 @@ def _do_map(
         raise NotImplementedError(kwargs)
     if len(args) != 2:
         raise NotImplementedError(args)
-    do_iter = get_guest_builtin('iter')
-    it = do_iter.invoke((args[1],), {}, {}, ictx)
+    it = _ITER_BUILTIN.invoke((args[1],), {}, {}, ictx)
     if it.is_exception():
         return it
     e = EMap(args[0], it.get_value())
@@ -1,13 +1,10 @@
-import os
 from typing import Text, Iterable, Dict, Any, Optional, Tuple
 
 from echo.interp_context import ICtx
 from echo.epy_object import EPyObject, EPyType, AttrWhere
-from echo.eobjects import get_guest_builtin
+from echo.eobjects import get_guest_builtin, E_PREFIX
 from echo.interp_result import Result, ExceptionData
 
-E_PREFIX = 'e' if 'E_PREFIX' not in os.environ else os.environ['E_PREFIX']
-
 
 class EModuleType(EPyType):
     def __repr__(self) -> Text:
@@ -7,6 +7,7 @@ from echo import eobjects
 
 
 class ENativeFn(EPyObject):
+    __slots__ = ('f', 'name', '__weakref__')
 
     def __init__(self, f: Callable[..., Result], name: str):
         self.f = f
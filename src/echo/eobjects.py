@@ -5,13 +5,13 @@ import sys
 import types
 from typing import (
     Text, Any, Dict, Tuple, Optional, Callable, Union, Type,
-    Deque, List
+    Deque, List, Set, FrozenSet
 )
 import weakref
 
 from echo.enative_fn import ENativeFn
 from echo.epy_object import (
-    EPyObject, AttrWhere, EPyType, try_invoke,
+    EPyObject, AttrWhere, EPyType, try_invoke, is_epy_object,
 )
 from echo.elog import log, debugged
 from echo.interp_context import ICtx
@@ -19,7 +19,7 @@ from echo.code_attributes import CodeAttributes
 from echo.interp_result import Result, ExceptionData, check_result
 from echo.common import memoize
 
-E_PREFIX = 'e' if 'E_PREFIX' not in os.environ else os.environ['E_PREFIX']
+E_PREFIX = os.environ.get('E_PREFIX', 'e')
 
 
 class EFunction(EPyObject):
@@ -296,7 +296,7 @@ def _find_name_in_mro(type_: EPyType, name: Text, ictx: ICtx) -> Any:
     log('eo:fnim', f'searching for {name} in {mro}')
     for cls in mro:
         if isinstance(cls, EBuiltin):
-            if cls.hasattr(name):
+            if cls.hasattr_where(name) is not None:
                 return cls.getattr(name, ictx).get_value()
         elif isinstance(cls, EPyType):
             d = cls.get_dict()
@@ -333,8 +333,8 @@ def _type_getattro(
                     f'meta_attr: {meta_attr}')
     if meta_attr is not NotFoundSentinel_singleton:
         if (isinstance(meta_attr, EPyObject)
-                and meta_attr.hasattr('__get__')
-                and meta_attr.hasattr('__set__')):
+                and meta_attr.hasattr_where('__get__') is not None
+                and meta_attr.hasattr_where('__set__') is not None):
             if not do_invoke_desc:
                 return (True, meta_attr)
             log('gi:ga', f'overriding descriptor: {meta_attr}')
@@ -347,7 +347,8 @@ def _type_getattro(
     attr = _find_name_in_mro(type_, name, ictx)
     if attr is not NotFoundSentinel_singleton:
         log('eo:ec:ga', f'dict attr {name!r} on {type_}: {attr}')
-        if isinstance(attr, EPyObject) and attr.hasattr('__get__'):
+        if (isinstance(attr, EPyObject)
+                and attr.hasattr_where('__get__') is not None):
             if not do_invoke_desc:
                 return (True, attr)
             f_result = attr.getattr('__get__', ictx)
@@ -361,7 +362,7 @@ def _type_getattro(
 
     if meta_attr is not NotFoundSentinel_singleton:
         if (isinstance(meta_attr, EPyObject)
-                and meta_attr.hasattr('__get__')):
+                and meta_attr.hasattr_where('__get__') is not None):
             log('gi:ga', f'non-overriding descriptor: {meta_attr}')
             if not do_invoke_desc:
                 return (True, meta_attr)
@@ -374,12 +375,12 @@ def _type_getattro(
             return (False, meta_attr)
         return Result(meta_attr)
 
-    if metatype.hasattr('__getattr__'):
+    if metatype.hasattr_where('__getattr__') is not None:
         meta_ga_ = metatype.getattr('__getattr__', ictx)
         if meta_ga_.is_exception():
             return meta_ga_
         meta_ga = meta_ga_.get_value()
-        if meta_ga.hasattr('__get__'):
+        if meta_ga.hasattr_where('__get__') is not None:
             if not do_invoke_desc:
                 return meta_ga
             meta_ga = invoke_desc(type_, meta_ga, ictx)
@@ -421,7 +422,7 @@ class EInstance(EPyObject):
         # Special members.
         if name in ('__class__', '__dict__'):
             return AttrWhere.SELF_SPECIAL
-        cls_hasattr = self.cls.hasattr(name)
+        cls_hasattr = self.cls.hasattr_where(name) is not None
         assert isinstance(cls_hasattr, bool), (self.cls, cls_hasattr)
         return AttrWhere.CLS if cls_hasattr else None
 
@@ -433,8 +434,8 @@ class EInstance(EPyObject):
         log('gi:ga', f'self: {self} name: {name} cls_attr: {cls_attr}')
 
         if (isinstance(cls_attr, EInstance)
-                and cls_attr.hasattr('__get__')
-                and cls_attr.hasattr('__set__')):
+                and cls_attr.hasattr_where('__get__') is not None
+                and cls_attr.hasattr_where('__set__') is not None):
             log('gi:ga', f'overriding descriptor: {cls_attr}')
             # Overriding descriptor.
             return invoke_desc(self, cls_attr, ictx)
@@ -448,7 +449,8 @@ class EInstance(EPyObject):
                 return Result(self.dict_)
 
         log('eo:ei', f'cls_attr: {cls_attr}')
-        if isinstance(cls_attr, EPyObject) and cls_attr.hasattr('__get__'):
+        if (isinstance(cls_attr, EPyObject)
+                and cls_attr.hasattr_where('__get__') is not None):
             log('gi:ga', f'non-overriding descriptor: {cls_attr}')
             return invoke_desc(self, cls_attr, ictx)
 
@@ -460,7 +462,7 @@ class EInstance(EPyObject):
         if dunder_getattr is not NotFoundSentinel_singleton:
             log('eo:ei:ga', f'__getattr__: {dunder_getattr}')
             if (isinstance(dunder_getattr, EPyObject)
-                    and dunder_getattr.hasattr('__get__')):
+                    and dunder_getattr.hasattr_where('__get__') is not None):
                 dunder_getattr = invoke_desc(self, dunder_getattr, ictx)
                 if dunder_getattr.is_exception():
                     return dunder_getattr
@@ -478,7 +480,7 @@ class EInstance(EPyObject):
             log('eo:ei:sa', f'cls_attr {cls_attr!r}')
 
         if (isinstance(cls_attr, EPyObject)
-                and cls_attr.hasattr('__set__')):
+                and cls_attr.hasattr_where('__set__') is not None):
             f_result = cls_attr.getattr('__set__', ictx)
             if f_result.is_exception():
                 return Result(f_result.get_exception())
@@ -520,6 +522,11 @@ def _get_bases(c: Union[EPyType, Type]) -> Tuple[Union[EPyType, Type], ...]:
 class EClass(EPyType):
     """Represents a user-defined class."""
 
+    # Bumped whenever the namespace of any user-defined class is mutated
+    # after creation; lookups cached against class namespaces record the
+    # epoch they were computed in and are stale once it moves on.
+    dict_epoch = 0
+
     def __init__(self, name: Text, dict_: Dict[Text, Any], *,
                  bases: Optional[Tuple[EPyType, ...]] = None,
                  metaclass: Optional[EPyType] = None, kwargs=None):
@@ -530,6 +537,8 @@ class EClass(EPyType):
         self.metaclass: Optional[EPyType] = metaclass
         self.kwargs = kwargs
         self.subclasses: weakref.WeakSet = weakref.WeakSet()
+        self._mro: Optional[Tuple[Union[EPyType, Type], ...]] = None
+        self._mro_ids: Optional[FrozenSet[int]] = None
 
         for base in self.bases:
             if isinstance(base, (EBuiltin, EClass)):
@@ -547,6 +556,9 @@ class EClass(EPyType):
     def note_subclass(self, derived: 'EClass') -> None:
         self.subclasses.add(derived)
 
+    def note_dict_mutation(self) -> None:
+        EClass.dict_epoch += 1
+
     def __repr__(self) -> Text:
         if isinstance(self.dict_, dict) and '__module__' in self.dict_:
             return '<{}class \'{}.{}\'>'.format(
@@ -557,6 +569,19 @@ class EClass(EPyType):
         return self.metaclass or get_guest_builtin('type')
 
     def get_mro(self) -> Tuple[Union[EPyType, Type], ...]:
+        # Bases are fixed at class creation, so the MRO is computed once.
+        if self._mro is None:
+            self._mro = self._compute_mro()
+        return self._mro
+
+    def is_subtype_of(self, other: EPyType) -> bool:
+        # Identities of the (fixed) MRO entries, so the test is one hash
+        # lookup; the entries themselves are kept alive by self._mro.
+        if self._mro_ids is None:
+            self._mro_ids = frozenset(id(t) for t in self.get_mro())
+        return id(other) in self._mro_ids
+
+    def _compute_mro(self) -> Tuple[Union[EPyType, Type], ...]:
         """The MRO is a preorder DFS of the 'derives from' relation."""
         derives_from = []  # (cls, base)
         frontier: Deque[Union[EPyType, Type]] = collections.deque([self])
@@ -688,6 +713,7 @@ class EClass(EPyType):
         if (sa is NotFoundSentinel_singleton
                 or sa is get_guest_builtin('object.__setattr__')):
             self.dict_[name] = value
+            self.note_dict_mutation()
             log('eo:ec:setattr',
                 f'updated self.dict_ {self.dict_} name {name} value {value}')
             return Result(None)
@@ -797,44 +823,46 @@ class GuestCoroutineType(EPyType):
 GuestCoroutineType_singleton = GuestCoroutineType()
 
 
+# Note: EBuiltin has no subclasses, so these predicates test the exact type
+# rather than walking the MRO in isinstance.
 def _is_type_builtin(x) -> bool:
-    return isinstance(x, EBuiltin) and x.name == 'type'
+    return type(x) is EBuiltin and x.name == 'type'
 
 
 def _is_dict_builtin(x) -> bool:
-    return isinstance(x, EBuiltin) and x.name == 'dict'
+    return type(x) is EBuiltin and x.name == 'dict'
 
 
 def _is_int_builtin(x) -> bool:
-    return isinstance(x, EBuiltin) and x.name == 'int'
+    return type(x) is EBuiltin and x.name == 'int'
 
 
 def _is_bool_builtin(x) -> bool:
-    return isinstance(x, EBuiltin) and x.name == 'bool'
+    return type(x) is EBuiltin and x.name == 'bool'
 
 
 def is_list_builtin(x) -> bool:
-    return isinstance(x, EBuiltin) and x.name == 'list'
+    return type(x) is EBuiltin and x.name == 'list'
 
 
 def _is_object_builtin(x) -> bool:
-    return isinstance(x, EBuiltin) and x.name == 'object'
+    return type(x) is EBuiltin and x.name == 'object'
 
 
 def _is_exception_builtin(x) -> bool:
-    return isinstance(x, EBuiltin) and x.name == 'Exception'
+    return type(x) is EBuiltin and x.name == 'Exception'
 
 
 def _is_base_exception_builtin(x) -> bool:
-    return isinstance(x, EBuiltin) and x.name == 'BaseException'
+    return type(x) is EBuiltin and x.name == 'BaseException'
 
 
 def _is_str_builtin(x) -> bool:
-    return isinstance(x, EBuiltin) and x.name == 'str'
+    return type(x) is EBuiltin and x.name == 'str'
 
 
 def is_tuple_builtin(x) -> bool:
-    return isinstance(x, EBuiltin) and x.name == 'tuple'
+    return type(x) is EBuiltin and x.name == 'tuple'
 
 
 @check_result
@@ -917,12 +945,24 @@ class EBuiltin(EPyType):
     )
 
     _registry: Dict[Text, Tuple[Callable, Optional[type]]] = {}
+    # The implementation functions held in _registry, for O(1) membership.
+    _registered_fns: Set[Callable] = set()
+
+    __slots__ = ('name', 'bound_self', '_get_method', '_invoke_handler',
+                 '__weakref__')
+
+    # Builtins have no namespace or globals of their own and never write to
+    # these, so all instances share the same (empty) dicts.
+    dict_: Dict[Text, Any] = {}
+    globals_: Dict[Text, Any] = {}
 
     def __init__(self, name: Text, bound_self: Any, singleton_ok: bool = True):
         self.name = name
         self.bound_self = bound_self
-        self.dict_: Dict[Text, Any] = {}
-        self.globals_: Dict[Text, Any] = {}
+        self._get_method: Optional[EMethod] = None
+        # The name is fixed for the builtin's lifetime, so resolve how it is
+        # invoked once here instead of on every call.
+        self._invoke_handler = _INVOKE_TABLE.get(name, _invoke_registered)
 
     def get_name(self) -> str:
         return 'builtin_type'
@@ -936,7 +976,10 @@ class EBuiltin(EPyType):
     def is_ebuiltin(cls, o: Any) -> bool:
         if isinstance(o, EBuiltin):
             return True
-        return o in cls._registry.values()
+        try:
+            return o in cls._registered_fns
+        except TypeError:  # Unhashable, so cannot be a registered function.
+            return False
 
     @classmethod
     def get_ebuiltin_type(cls, name: Text) -> type:
@@ -946,7 +989,10 @@ class EBuiltin(EPyType):
 
     @classmethod
     def register(cls, name: Text, f: Callable, t: Optional[type]) -> None:
+        if name in cls._registry:
+            cls._registered_fns.discard(cls._registry[name][0])
         cls._registry[name] = (f, t)
+        cls._registered_fns.add(f)
 
     def __repr__(self) -> Text:
         if self.name in self.BUILTIN_TYPES:
@@ -989,7 +1035,7 @@ class EBuiltin(EPyType):
         pass
 
     def is_subtype_of(self, other: EPyType) -> bool:
-        if _is_type_builtin(self) and _is_object_builtin(other):
+        if self.name == 'type' and _is_object_builtin(other):
             return True
         if self is other:
             return True
@@ -1003,69 +1049,25 @@ class EBuiltin(EPyType):
                ictx: ICtx,
                globals_: Optional[Dict[Text, Any]] = None) -> Result[Any]:
         assert isinstance(ictx, ICtx), ictx
-        if self.name == 'zip':
-            return Result(zip(*args))
-        if self.name == 'reversed':
-            return Result(reversed(*args))
-        if self.name == 'chr':
-            return Result(chr(*args))
-        if self.name == 'len':
-            return _do_len(args, ictx)
-        if self.name == 'hasattr':
-            return do_hasattr(args, ictx)
-        if self.name == 'dir':
-            if not args and not kwargs:
-                if locals_dict is not None:
-                    return Result(list(locals_dict.keys()))
-                assert globals_ is not None
-                return Result(list(globals_.keys()))
-            return _do_dir(args, kwargs, ictx)
-        if self.name == 'vars':
-            if len(args) == 0 and not kwargs:
-                return Result(locals_dict)
-            return _do_vars(args, kwargs, ictx)
-        if self.name == 'getattr':
-            return do_getattr(args, kwargs, ictx)
-        if self.name == 'setattr':
-            return do_setattr(args, kwargs, ictx)
-        if self.name == 'type.__call__':
-            if self.bound_self is not None:
-                args = (self.bound_self,) + args
-            return self._registry[self.name][0](args, kwargs, globals_, ictx)
-
-        # Check if the builtin has been registered from an external location.
-        if self.name in self._registry:
-            if self.bound_self is not None:
-                args = (self.bound_self,) + args
-            return self._registry[self.name][0](args, kwargs, ictx)
-
-        raise NotImplementedError(
-                'Did not find {!r} in {!r}'.format(self.name,
-                                                   self._registry.keys()))
+        return self._invoke_handler(self, args, kwargs, locals_dict, ictx,
+                                    globals_)
 
     def hasattr_where(self, name: Text) -> Optional[AttrWhere]:
         if name in self.dict_:
             return AttrWhere.SELF_DICT
         if (self.name in self.BUILTIN_TYPES
-                and f'{self.name}.{name}' in self.BUILTIN_FNS):
+                and name in _get_builtin_type_attrs(self.name)):
             return AttrWhere.SELF_SPECIAL
-        if self.name == 'str' and name in ('maketrans',):
-            return AttrWhere.SELF_SPECIAL
-        if (self.name in self.BUILTIN_TYPES
-                and name in ('__mro__', '__dict__',)):
+        if self.name == 'str' and name == 'maketrans':
             return AttrWhere.SELF_SPECIAL
         if self.name in self.BUILTIN_FNS and name == '__get__':
             return AttrWhere.CLS
         if (self.name in self.BUILTIN_TYPES
-                and name in ('__new__', '__init__', '__dict__', '__str__',
-                             '__repr__', '__eq__', '__ne__', '__new__',
-                             '__name__')):
+                and name in _BUILTIN_TYPE_SPECIAL_NAMES):
             return AttrWhere.SELF_SPECIAL
-        if self.name == 'object' and name in (
-                '__subclasshook__', '__bases__', '__setattr__', '__repr__',):
+        if self.name == 'object' and name in _OBJECT_SPECIAL_NAMES:
             return AttrWhere.SELF_SPECIAL
-        if self.name == 'type' and name in ('__subclasses__', 'mro',
-                                            '__call__', '__repr__',):
+        if self.name == 'type' and name in _TYPE_SPECIAL_NAMES:
             return AttrWhere.SELF_SPECIAL
         if name == '__eq__':
             return AttrWhere.CLS
@@ -1091,93 +1093,110 @@ class EBuiltin(EPyType):
             return Result(self.bound_self)
 
         if self.name in self.BUILTIN_TYPES:
-            if name == '__module__':
-                return Result('builtins')
-            if name == '__bases__':
-                return Result(self.get_bases())
-
-        if (self.name in self.BUILTIN_TYPES and
-                name in ('__name__', '__qualname__')):
-            return Result(self.name)
-
-        if self.name in self.BUILTIN_TYPES and name in ('__doc__'):
-            return Result(getattr(builtins, self.name).__doc__)
-
-        if (self.name in self.BUILTIN_TYPES
-                and name in ('__annotations__',)):
-            return Result(ExceptionData(
-                None, None, AttributeError('__annotations__')))
-
-        if self.name in self.BUILTIN_TYPES:
-            fullname = f'{self.name}.{name}'
-            if fullname in self.BUILTIN_FNS:
-                return Result(get_guest_builtin(fullname))
-
-        if self.name == 'int':
-            if name == '__dict__':
-                return Result({
-                    '__new__': get_guest_builtin('int.__new__'),
-                    '__repr__': get_guest_builtin('int.__repr__'),
-                })
-
-        if self.name == 'Exception':
-            if name == '__new__':
-                return Result(get_guest_builtin('Exception.__new__'))
-            if name == '__init__':
-                return Result(get_guest_builtin('Exception.__init__'))
-
-        if self.name == 'dict':
-            if name == '__new__':
-                return Result(get_guest_builtin('dict.__new__'))
-            if name == '__dict__':
-                return Result({
-                    'fromkeys': get_guest_builtin('dict.fromkeys'),
-                })
-
-        if (self.name in self.BUILTIN_FNS
-                and name == '__get__'):
-            return Result(EMethod(ENativeFn(
-                self._get, 'ebuiltin.__get__'), bound_self=self))
-
-        if (self.name in self.BUILTIN_FNS
-                and name == '__call__'):
-            return Result(self)
-
-        if self.name == 'object':
-            if name == '__format__':
-                return Result(get_guest_builtin('object.__format__'))
-            if name == '__reduce_ex__':
-                return Result(get_guest_builtin('object.__reduce_ex__'))
-            if name == '__subclasshook__':
-                return Result(get_guest_builtin('object.__subclasshook__'))
-            if name == '__bases__':
-                return Result(())
-            if name == '__dict__':  # Fake it for now.
-                return Result({})
-
-        if self.name == 'type':
-            if name == '__name__':
-                return Result(get_guest_builtin('type.__name__'))
-            if name == '__dict__':  # Fake it for now.
-                return Result({})
+            attr = _get_builtin_type_attrs(self.name).get(name)
+            if attr is not None:
+                return Result(attr)
+            special = _BUILTIN_TYPE_SPECIAL_ATTRS.get(name)
+            if special is not None:
+                return special(self)
+        elif self.name in self.BUILTIN_FNS:
+            if name == '__get__':
+                if self._get_method is None:
+                    self._get_method = EMethod(ENativeFn(
+                        self._get, 'ebuiltin.__get__'), bound_self=self)
+                return Result(self._get_method)
+            if name == '__call__':
+                return Result(self)
 
         if name == '__eq__':
             return Result(get_guest_builtin('object.__eq__'))
         if name == '__ne__':
             return Result(get_guest_builtin('object.__ne__'))
 
-        if self.name in self.BUILTIN_TYPES:
-            if name == '__mro__':
-                return Result(self.get_mro())
-            if name == '__dict__':  # Fake it for now.
-                return Result({})
-
         raise NotImplementedError(self, name)
 
     def setattr(self, name: Text, value: Any, ictx: ICtx) -> Any:
         raise NotImplementedError(self, name, value)
 
 
+# Attributes on builtin types that resolve to (constant) guest builtins, keyed
+# by builtin type name -- populated lazily by _get_builtin_type_attrs, since
+# the guest builtins cannot be created while this module is still loading.
+_BUILTIN_TYPE_ATTRS: Dict[Text, Dict[Text, EBuiltin]] = {}
+
+# Attributes that resolve to guest builtins but are not listed in
+# EBuiltin.BUILTIN_FNS, keyed by builtin type name.
+_BUILTIN_TYPE_EXTRA_ATTRS: Dict[Text, Dict[Text, Text]] = {
+    'Exception': {
+        '__new__': 'Exception.__new__',
+        '__init__': 'Exception.__init__',
+    },
+    'dict': {
+        '__new__': 'dict.__new__',
+    },
+}
+
+
+def _get_builtin_type_attrs(type_name: Text) -> Dict[Text, EBuiltin]:
+    try:
+        return _BUILTIN_TYPE_ATTRS[type_name]
+    except KeyError:
+        pass
+    attrs = {
+        '__eq__': get_guest_builtin('object.__eq__'),
+        '__ne__': get_guest_builtin('object.__ne__'),
+    }
+    prefix = type_name + '.'
+    for fullname in EBuiltin.BUILTIN_FNS:
+        if fullname.startswith(prefix):
+            attrs[fullname[len(prefix):]] = get_guest_builtin(fullname)
+    for name, fullname in _BUILTIN_TYPE_EXTRA_ATTRS.get(
+            type_name, {}).items():
+        attrs[name] = get_guest_builtin(fullname)
+    _BUILTIN_TYPE_ATTRS[type_name] = attrs
+    return attrs
+
+
+def _builtin_type_dict(self: EBuiltin) -> Result[Any]:
+    if self.name == 'int':
+        return Result({
+            '__new__': get_guest_builtin('int.__new__'),
+            '__repr__': get_guest_builtin('int.__repr__'),
+        })
+    if self.name == 'dict':
+        return Result({
+            'fromkeys': get_guest_builtin('dict.fromkeys'),
+        })
+    return Result({})  # Fake it for now.
+
+
+# Attributes on builtin types that are computed from the builtin on access.
+_BUILTIN_TYPE_SPECIAL_ATTRS: Dict[Text, Callable[[EBuiltin], Result[Any]]] = {
+    '__module__': lambda self: Result('builtins'),
+    '__bases__': lambda self: Result(self.get_bases()),
+    '__name__': lambda self: Result(self.name),
+    '__qualname__': lambda self: Result(self.name),
+    '__doc__': lambda self: Result(getattr(builtins, self.name).__doc__),
+    '__annotations__': lambda self: Result(ExceptionData(
+        None, None, AttributeError('__annotations__'))),
+    '__mro__': lambda self: Result(self.get_mro()),
+    '__dict__': _builtin_type_dict,
+}
+
+# Names EBuiltin.hasattr_where reports as special on builtin types generally
+# and on `object` / `type` specifically.
+_BUILTIN_TYPE_SPECIAL_NAMES = frozenset((
+    '__mro__', '__dict__', '__new__', '__init__', '__str__', '__repr__',
+    '__eq__', '__ne__', '__name__',
+))
+_OBJECT_SPECIAL_NAMES = frozenset((
+    '__subclasshook__', '__bases__', '__setattr__', '__repr__',
+))
+_TYPE_SPECIAL_NAMES = frozenset((
+    '__subclasses__', 'mro', '__call__', '__repr__',
+))
+
+
 def register_builtin(
         name: Text,
         type_: Optional[type] = None) -> Callable[[Callable], Callable]:
@@ -1220,6 +1239,18 @@ def _do_dir(args: Tuple[Any, ...],
     return Result(dir(o))
 
 
+def _intern_name(name: Any) -> Any:
+    """Interns attribute names that arrive as (possibly computed) strings.
+
+    Names that come from code objects are already interned; doing the same
+    for names built at runtime means the name comparisons and namespace dict
+    lookups downstream can succeed on the identity check.
+    """
+    if type(name) is str:
+        return sys.intern(name)
+    return name
+
+
 ###################
 # Public functions
 
@@ -1229,7 +1260,7 @@ def do_getitem(args: Tuple[Any, ...], ictx: ICtx) -> Result[Any]:
     o, name = args
     if not isinstance(o, EPyObject):
         return Result(o[name])
-    if o.hasattr('__getitem__'):
+    if o.hasattr_where('__getitem__') is not None:
         f = o.getattr('__getitem__', ictx).get_value()
         return ictx.call(f, (args[1],), {}, {}, globals_=f.globals_)
     raise NotImplementedError(o, name)
@@ -1258,7 +1289,7 @@ def do_delitem(args: Tuple[Any, ...], ictx: ICtx) -> Result[None]:
     if not isinstance(o, EPyObject):
         del o[name]
         return Result(None)
-    if o.hasattr('__delitem__'):
+    if o.hasattr_where('__delitem__') is not None:
         f = o.getattr('__delitem__', ictx).get_value()
         res = ictx.call(f, (args[1],), {}, {}, globals_=f.globals_)
         if res.is_exception():
@@ -1272,8 +1303,9 @@ def do_hasattr(args: Tuple[Any, ...], ictx: ICtx) -> Result[bool]:
     assert len(args) == 2, args
     o, attr = args
     assert isinstance(attr, str), attr
+    attr = _intern_name(attr)
 
-    if not isinstance(o, EPyObject):
+    if not is_epy_object(o):
         b = hasattr(o, attr)
         log('eo:hasattr()', lambda: f'{o}, {attr} => {b}')
         return Result(b)
@@ -1295,6 +1327,7 @@ def do_getattr(args: Tuple[Any, ...],
     assert 2 <= len(args) <= 3, args
     assert not kwargs, kwargs
     o, attr, *default = args
+    attr = _intern_name(attr)
     # TODO(cdleary): 2020-01-01 genericize this
     if type(o) is tuple and attr == '__class__':
         return Result(get_guest_builtin('tuple'))
@@ -1307,16 +1340,25 @@ def do_getattr(args: Tuple[Any, ...],
     if (type(o) in (int, str, tuple, list, bytearray)
             and f'{clsname}.{attr}' in EBuiltin.BUILTIN_FNS):
         return Result(get_guest_builtin_self(f'{clsname}.{attr}', o))
-    if not isinstance(o, EPyObject):
+    if not is_epy_object(o):
         try:
             a = getattr(o, attr, *default)
         except AttributeError as e:
             return Result(ExceptionData(None, None, e))
         else:
             return Result(a)
-    if default and not o.hasattr(attr):
+    if not default:
+        return o.getattr(attr, ictx)
+    # Note: the hasattr probe cannot be dropped in favor of catching the
+    # AttributeError, since some getattr implementations do not support
+    # lookups of names they do not have.
+    if o.hasattr_where(attr) is None:
+        return Result(default[0])
+    r = o.getattr(attr, ictx)
+    if (r.is_exception()
+            and isinstance(r.get_exception().exception, AttributeError)):
         return Result(default[0])
-    return o.getattr(attr, ictx)
+    return r
 
 
 @check_result
@@ -1327,6 +1369,7 @@ def do_setattr(args: Tuple[Any, ...],
     assert len(args) == 3, args
     assert not kwargs, kwargs
     obj, name, value = args
+    name = _intern_name(name)
     if isinstance(obj, EPyObject):
         res = obj.setattr(name, value, ictx=ictx)
         if res.is_exception():
@@ -1369,3 +1412,65 @@ def _do_vars(args: Tuple[Any, ...],
              ictx: ICtx) -> Result[Any]:
     assert len(args) == 1
     return do_getattr((args[0], '__dict__'), {}, ictx)
+
+
+def _invoke_dir(self: EBuiltin, args: Tuple[Any, ...],
+                kwargs: Dict[Text, Any], locals_dict: Dict[Text, Any],
+                ictx: ICtx,
+                globals_: Optional[Dict[Text, Any]]) -> Result[Any]:
+    if not args and not kwargs:
+        if locals_dict is not None:
+            return Result(list(locals_dict.keys()))
+        assert globals_ is not None
+        return Result(list(globals_.keys()))
+    return _do_dir(args, kwargs, ictx)
+
+
+def _invoke_vars(self: EBuiltin, args: Tuple[Any, ...],
+                 kwargs: Dict[Text, Any], locals_dict: Dict[Text, Any],
+                 ictx: ICtx,
+                 globals_: Optional[Dict[Text, Any]]) -> Result[Any]:
+    if len(args) == 0 and not kwargs:
+        return Result(locals_dict)
+    return _do_vars(args, kwargs, ictx)
+
+
+def _invoke_type_call(self: EBuiltin, args: Tuple[Any, ...],
+                      kwargs: Dict[Text, Any], locals_dict: Dict[Text, Any],
+                      ictx: ICtx,
+                      globals_: Optional[Dict[Text, Any]]) -> Result[Any]:
+    if self.bound_self is not None:
+        args = (self.bound_self,) + args
+    return self._registry[self.name][0](args, kwargs, globals_, ictx)
+
+
+def _invoke_registered(self: EBuiltin, args: Tuple[Any, ...],
+                       kwargs: Dict[Text, Any], locals_dict: Dict[Text, Any],
+                       ictx: ICtx,
+                       globals_: Optional[Dict[Text, Any]]) -> Result[Any]:
+    # Check if the builtin has been registered from an external location.
+    if self.name in self._registry:
+        if self.bound_self is not None:
+            args = (self.bound_self,) + args
+        return self._registry[self.name][0](args, kwargs, ictx)
+
+    raise NotImplementedError(
+            'Did not find {!r} in {!r}'.format(self.name,
+                                               self._registry.keys()))
+
+
+# Builtins whose invocation is handled directly by EBuiltin.invoke (instead of
+# via the registry) -- maps builtin name to a handler that takes
+# `(ebuiltin, args, kwargs, locals_dict, ictx, globals_)`.
+_INVOKE_TABLE: Dict[Text, Callable[..., Result[Any]]] = {
+    'zip': lambda s, a, k, ld, i, g: Result(zip(*a)),
+    'reversed': lambda s, a, k, ld, i, g: Result(reversed(*a)),
+    'chr': lambda s, a, k, ld, i, g: Result(chr(*a)),
+    'len': lambda s, a, k, ld, i, g: _do_len(a, i),
+    'hasattr': lambda s, a, k, ld, i, g: do_hasattr(a, i),
+    'dir': _invoke_dir,
+    'vars': _invoke_vars,
+    'getattr': lambda s, a, k, ld, i, g: do_getattr(a, k, i),
+    'setattr': lambda s, a, k, ld, i, g: do_setattr(a, k, i),
+    'type.__call__': _invoke_type_call,
+}
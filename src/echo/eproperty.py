@@ -12,12 +12,26 @@ from echo.interp_context import ICtx
 
 
 class EProperty(EPyObject):
+    __slots__ = ('fget', 'fset', 'doc', '_get_method', '_set_method',
+                 '_setter_method', '_fget_call', '_fset_call', '__weakref__')
+
     def __init__(self, fget: EPyObject, fset: Optional[EPyObject],
                  doc: Optional[Text]):
         assert isinstance(fget, EPyObject), fget
         self.fget = fget
         self.fset = fset
         self.doc = doc
+        # The descriptor methods are resolved on every access through the
+        # property, so bind them once up front.
+        self._get_method = EMethod(ENativeFn(
+            self._get, 'eproperty.__get__'), bound_self=self)
+        self._set_method = EMethod(ENativeFn(
+            self._set, 'eproperty.__set__'), bound_self=self)
+        self._setter_method = EMethod(ENativeFn(
+            self._setter, 'eproperty.setter'), bound_self=self)
+        # Resolved `__call__` of fget/fset, looked up on first use.
+        self._fget_call: Optional[EPyObject] = None
+        self._fset_call: Optional[EPyObject] = None
 
     def get_type(self) -> EPyType:
         return get_guest_builtin('property')
@@ -39,11 +53,12 @@ class EProperty(EPyObject):
             return Result(self)
         log('ep:get', f'fget: {self.fget} obj: {obj} objtype: {objtype}')
         assert _self is self
-        do_call_ = self.fget.getattr('__call__', ictx)
-        if do_call_.is_exception():
-            return do_call_
-        do_call = do_call_.get_value()
-        return try_invoke(do_call, (obj,), kwargs, locals_dict, ictx)
+        if self._fget_call is None:
+            do_call_ = self.fget.getattr('__call__', ictx)
+            if do_call_.is_exception():
+                return do_call_
+            self._fget_call = do_call_.get_value()
+        return try_invoke(self._fget_call, (obj,), kwargs, locals_dict, ictx)
 
     @check_result
     def _set(self,
@@ -57,11 +72,13 @@ class EProperty(EPyObject):
         assert eself is self
         if self.fset is None:
             raise NotImplementedError
-        do_call_ = self.fset.getattr('__call__', ictx)
-        if do_call_.is_exception():
-            return do_call_
-        do_call = do_call_.get_value()
-        return try_invoke(do_call, (obj, value), kwargs, locals_dict, ictx)
+        if self._fset_call is None:
+            do_call_ = self.fset.getattr('__call__', ictx)
+            if do_call_.is_exception():
+                return do_call_
+            self._fset_call = do_call_.get_value()
+        return try_invoke(self._fset_call, (obj, value), kwargs, locals_dict,
+                          ictx)
 
     @check_result
     def _setter(self,
@@ -81,14 +98,11 @@ class EProperty(EPyObject):
         if name == 'fset':
             return Result(self.fset)
         if name == '__get__':
-            return Result(EMethod(ENativeFn(
-                self._get, 'eproperty.__get__'), bound_self=self))
+            return Result(self._get_method)
         if name == '__set__':
-            return Result(EMethod(ENativeFn(
-                self._set, 'eproperty.__set__'), bound_self=self))
+            return Result(self._set_method)
         if name == 'setter':
-            return Result(EMethod(ENativeFn(
-                self._setter, 'eproperty.setter'), bound_self=self))
+            return Result(self._setter_method)
         if name == '__doc__':
             return Result(self.doc)
         return Result(ExceptionData(None, name, AttributeError(name)))
@@ -1,7 +1,7 @@
-import abc
-import contextlib
-from enum import Enum
-from typing import Text, Any, Optional, Tuple, Dict, Union, Type
+import threading
+from typing import (
+    Text, Any, Optional, Tuple, Dict, Union, Type, Set, List, ClassVar,
+)
 
 from echo.interp_context import ICtx
 from echo.interp_result import Result, ExceptionData
@@ -17,24 +17,64 @@ def safer_repr(x: Any) -> Text:
         return f'<reentrant {type(x)!r}: {id(x)}>'
 
 
-class AttrWhere(Enum):
-    SELF_DICT = 'self_dict'
-    SELF_SPECIAL = 'self_special'
-    CLS = 'cls'
+class AttrWhere:
+    """Where `hasattr_where` found an attribute.
 
+    The members are plain class attributes holding singleton instances rather
+    than an Enum: they are returned from every attribute probe, and reading an
+    Enum member goes through EnumMeta, which is several times slower.
+    """
+    __slots__ = ('name',)
 
-ictx_data = []
+    SELF_DICT: 'AttrWhere'
+    SELF_SPECIAL: 'AttrWhere'
+    CLS: 'AttrWhere'
+
+    def __init__(self, name: Text):
+        self.name = name
+
+    def __repr__(self) -> Text:
+        return f'AttrWhere.{self.name}'
+
+
+AttrWhere.SELF_DICT = AttrWhere('SELF_DICT')
+AttrWhere.SELF_SPECIAL = AttrWhere('SELF_SPECIAL')
+AttrWhere.CLS = AttrWhere('CLS')
+
+
+class _ThreadICtx(threading.local):
+    """Per-thread stack of `(locals_dict, globals_, ictx)` established for
+    native code that calls back into guest objects."""
+
+    def __init__(self) -> None:
+        self.stack: List[Tuple[Dict[Text, Any], Optional[Dict[Text, Any]],
+                               ICtx]] = []
+
+
+_thread_ictx = _ThreadICtx()
+
+
+class _EstablishedICtx:
+    # Note: a plain context manager class rather than @contextmanager, which
+    # costs a generator plus two resumptions on every native-to-guest entry.
+    __slots__ = ('data', 'stack')
+
+    def __init__(self, data: Tuple[Dict[Text, Any], Optional[Dict[Text, Any]],
+                                   ICtx]):
+        self.data = data
+        self.stack = _thread_ictx.stack
+
+    def __enter__(self) -> None:
+        self.stack.append(self.data)
+
+    def __exit__(self, *exc_info) -> None:
+        self.stack.pop()
 
 
-@contextlib.contextmanager
 def establish_ictx(locals_dict: Dict[Text, Any],
                    globals_: Optional[Dict[Text, Any]],
-                   ictx: ICtx):
-    data = (locals_dict, globals_, ictx)
-    ictx_data.append(data)
-    yield
-    popped = ictx_data.pop()
-    assert popped is data
+                   ictx: ICtx) -> _EstablishedICtx:
+    return _EstablishedICtx((locals_dict, globals_, ictx))
 
 
 class NoContextException(Exception):
@@ -42,15 +82,42 @@ class NoContextException(Exception):
 
 
 def _find_thread_ictx():
-    if not ictx_data:
+    stack = _thread_ictx.stack
+    if not stack:
         raise NoContextException
-    return ictx_data[-1]
+    return stack[-1]
+
+
+# Every class deriving from EPyObject, so that hot paths can classify objects
+# with an exact-type set lookup instead of an isinstance MRO walk.
+EPYOBJECT_TYPES: Set[type] = set()
 
 
-class EPyObject(abc.ABC):
+def is_epy_object(o: Any) -> bool:
+    return type(o) in EPYOBJECT_TYPES
+
+
+class EPyObject:
+    # Subclasses that are instantiated in bulk declare __slots__; the empty
+    # slots here keep those subclasses free of a per-instance __dict__.
+    __slots__ = ()
+
+    # Whether the class provides its own `invoke` (see try_invoke); computed
+    # per subclass as it is defined.
+    _IS_CALLABLE: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        EPYOBJECT_TYPES.add(cls)
+        cls._IS_CALLABLE = cls.invoke is not EPyObject.invoke
 
     def __call__(self, *args, **kwargs) -> Any:
-        locals_dict, globals_, ictx = _find_thread_ictx()
+        # Note: _find_thread_ictx() inlined, this is on every native-to-guest
+        # call.
+        stack = _thread_ictx.stack
+        if not stack:
+            raise NoContextException
+        locals_dict, globals_, ictx = stack[-1]
         res = self.invoke(args, kwargs, locals_dict=locals_dict, ictx=ictx,
                           globals_=globals_)
         if res.is_exception():
@@ -67,26 +134,21 @@ class EPyObject(abc.ABC):
                globals_: Optional[Dict[Text, Any]] = None) -> Result[Any]:
         raise NotImplementedError(self)
 
-    @abc.abstractmethod
     def get_type(self) -> 'EPyType':
         raise NotImplementedError
 
-    @abc.abstractmethod
     def getattr(self, name: Text, ictx: ICtx) -> Result[Any]:
         raise NotImplementedError(self, name)
 
-    @abc.abstractmethod
     def setattr(self, name: Text, value: Any, ictx: ICtx) -> Result[None]:
         raise NotImplementedError(self, name, value)
 
-    @abc.abstractmethod
     def hasattr_where(self, name: Text) -> Optional[AttrWhere]:
         raise NotImplementedError(self, name)
 
     def hasattr(self, name: Text) -> bool:
         return self.hasattr_where(name) is not None
 
-    # @abc.abstractmethod
     def delattr(self, name: Text) -> Any:
         raise NotImplementedError(self, name)
 
@@ -94,28 +156,26 @@ class EPyObject(abc.ABC):
 class EPyType(EPyObject):
     """Abstract base class for type objects -- it is itself an EPyObject."""
 
+    __slots__ = ()
+
     def has_standard_getattr(self) -> bool:
         return True
 
-    @abc.abstractmethod
     def get_name(self) -> str:
         raise NotImplementedError
 
-    @abc.abstractmethod
     def get_mro(self) -> Tuple[Union['EPyType', Type], ...]:
         raise NotImplementedError
 
-    @abc.abstractmethod
     def get_bases(self) -> Tuple['EPyType', ...]:
         raise NotImplementedError
 
-    @abc.abstractmethod
     def get_dict(self) -> Dict[Text, Any]:
         raise NotImplementedError(self)
 
     def is_subtype_of(self, other: 'EPyType') -> bool:
         mro = self.get_mro()
-        log('epyo:iso', f'other: {other} mro: {mro}')
+        log('epyo:iso', lambda: f'other: {other} mro: {mro}')
         is_subtype = other in mro
         if self is other:
             assert is_subtype
@@ -124,7 +184,7 @@ class EPyType(EPyObject):
 
 def try_invoke(o: EPyObject, args: Tuple[Any, ...], kwargs: Dict[str, Any],
                locals_dict: Dict[str, Any], ictx: ICtx) -> Result[Any]:
-    if not hasattr(o, 'invoke'):
+    if not getattr(type(o), '_IS_CALLABLE', False):
         return Result(ExceptionData(
             None, None, TypeError(
                 'type {!r} is not callable'.format(o.get_type().get_name()))))
@@ -9,29 +9,45 @@ from echo.eobjects import (
 )
 from echo.interp_context import ICtx
 
+# Guest builtins are memoized singletons, so resolve this one once.
+_STATICMETHOD_BUILTIN = get_guest_builtin('staticmethod')
+
 
 class EStaticMethod(EPyObject):
+    __slots__ = ('f', '_get_method', '_get_result')
+
+    # {name: (where hasattr_where finds it, getter)} for every attribute.
+    _ATTR_TABLE = {
+        '__func__': (AttrWhere.SELF_SPECIAL, lambda self: Result(self.f)),
+        '__get__': (AttrWhere.CLS,
+                    lambda self: Result(self._get_get_method())),
+    }
+
     def __init__(self, f: EPyObject):
         self.f = f
-        self.dict_: Dict[str, Any] = {}
+        # f never changes, so __get__ can hand back the same Result.
+        self._get_result = Result(f)
+        self._get_method: Optional[ENativeFn] = None
 
     def __repr__(self) -> Text:
         return f'<{E_PREFIX}staticmethod object at {id(self):#x}>'
 
     def get_type(self) -> EPyType:
-        return get_guest_builtin('staticmethod')
+        return _STATICMETHOD_BUILTIN
 
     def invoke(self, *args, **kwargs) -> Result[Any]:
         return self.f.invoke(*args, **kwargs)
 
+    def __call__(self, *args, **kwargs) -> Any:
+        # Calling a staticmethod from native code is calling its function.
+        return self.f(*args, **kwargs)
+
     def hasattr_where(self, name: Text) -> Optional[AttrWhere]:
-        if name in self.dict_:
-            return AttrWhere.SELF_DICT
-        if name == '__func__':
-            return AttrWhere.SELF_SPECIAL
-        if name == '__get__':
-            return AttrWhere.CLS
-        return None
+        entry = self._ATTR_TABLE.get(name)
+        return None if entry is None else entry[0]
+
+    def hasattr(self, name: Text) -> bool:
+        return name in self._ATTR_TABLE
 
     @check_result
     def _get(self,
@@ -40,16 +56,19 @@ class EStaticMethod(EPyObject):
              locals_dict: Dict[Text, Any],
              ictx: ICtx,
              globals_: Optional[Dict[Text, Any]] = None) -> Result[Any]:
-        return Result(self.f)
+        return self._get_result
+
+    def _get_get_method(self) -> ENativeFn:
+        if self._get_method is None:
+            self._get_method = ENativeFn(self._get, 'estaticmethod.__get__')
+        return self._get_method
 
     @check_result
     def getattr(self, name: Text, ictx: ICtx) -> Result[Any]:
-        if name == '__get__':
-            return Result(ENativeFn(
-                self._get, 'estaticmethod.__get__'))
-        if name == '__func__':
-            return Result(self.f)
-        raise NotImplementedError(name)
+        entry = self._ATTR_TABLE.get(name)
+        if entry is None:
+            raise NotImplementedError(name)
+        return entry[1](self)
 
     def setattr(self, name: Text, value: Any, ictx: ICtx) -> Result[None]:
         raise NotImplementedError(name, value)
@@ -1,17 +1,23 @@
-import os
 from typing import Text, Tuple, Any, Optional
 
 from echo.epy_object import EPyObject, AttrWhere, EPyType
 from echo.interp_result import Result
-from echo.eobjects import get_guest_builtin
+from echo.eobjects import get_guest_builtin, E_PREFIX
 from echo.interp_context import ICtx
 
-E_PREFIX = 'e' if 'E_PREFIX' not in os.environ else os.environ['E_PREFIX']
+# Guest builtins are memoized singletons, so resolve this one once.
+_TYPE_BUILTIN = get_guest_builtin('type')
+
+# Neither repr depends on the instance.
+_TRACEBACK_TYPE_REPR = f"<{E_PREFIX}class 'traceback'>"
+_TRACEBACK_REPR = f'<{E_PREFIX}traceback object>'
 
 
 class ETracebackType(EPyType):
+    __slots__ = ()
+
     def __repr__(self) -> Text:
-        return f"<{E_PREFIX}class 'traceback'>"
+        return _TRACEBACK_TYPE_REPR
 
     def get_name(self) -> str: return 'traceback'
     def get_dict(self): raise NotImplementedError
@@ -19,7 +25,7 @@ class ETracebackType(EPyType):
     def get_mro(self) -> Tuple[EPyType, ...]: raise NotImplementedError
 
     def get_type(self) -> EPyType:
-        return get_guest_builtin('type')
+        return _TYPE_BUILTIN
 
     def getattr(self, name: Text, ictx: ICtx) -> Result[Any]:
         raise NotImplementedError
@@ -35,32 +41,49 @@ ETracebackType_singleton = ETracebackType()
 
 
 class ETraceback(EPyObject):
+    __slots__ = ('frame', 'lasti', 'lineno')
+
+    _GETATTR_TABLE = {
+        'tb_frame': lambda self: Result(self.frame),
+        'tb_lasti': lambda self: Result(self.lasti),
+        'tb_lineno': lambda self: Result(self.lineno),
+    }
+
     def __init__(self, frame: Any, lasti: int, lineno: int):
         self.frame = frame
         self.lasti = lasti
         self.lineno = lineno
 
     def __repr__(self) -> Text:
-        return f'<{E_PREFIX}traceback object>'
+        return _TRACEBACK_REPR
 
     def get_type(self) -> EPyType:
         return ETracebackType_singleton
 
     def hasattr_where(self, name: Text) -> Optional[AttrWhere]:
-        if name in ('tb_frame', 'tb_lasti', 'tb_lineno'):
+        if name in self._GETATTR_TABLE:
             return AttrWhere.SELF_SPECIAL
         return None
 
+    def hasattr(self, name: Text) -> bool:
+        return name in self._GETATTR_TABLE
+
     def getattr(self, name: Text, ictx: ICtx) -> Result[Any]:
-        if name == 'tb_frame':
-            return Result(self.frame)
-        raise NotImplementedError
+        handler = self._GETATTR_TABLE.get(name)
+        if handler is None:
+            raise NotImplementedError
+        return handler(self)
 
     def setattr(self, name: Text, value: Any, ictx: ICtx) -> Any:
         raise NotImplementedError
 
 
 def walk(tb: ETraceback):
+    """Yields `(filename, lineno)` for each frame from `tb` outward.
+
+    Only used for error reporting; this is object-graph traversal, not numeric
+    work, so it is not a candidate for JIT compilation.
+    """
     frame = tb.frame
     while frame:
         yield frame.f_code.co_filename, frame.f_lineno
@@ -1,22 +1,24 @@
 import dis
 import itertools
-import functools
 import os
 import sys
 import types
+import weakref
 from typing import (
     List, Any, Text, Optional, Dict, Tuple, Callable, Union, Type,
+    Sequence,
 )
 from enum import Enum
 
 from echo import bc_helpers
 from echo import iteration_helpers
+from echo import elog
 from echo.elog import log
 from echo.interp_context import ICtx
 from echo import import_routines
 from echo import etraceback
 from echo.eobjects import (
-    EFunction, EPyObject,
+    EFunction, EPyObject, EClass, EInstance, EMethod,
     GuestCoroutine, get_guest_builtin,
     do_getitem, do_setitem, do_hasattr, do_getattr,
     do_delitem, do_setattr
@@ -31,6 +33,7 @@ from echo.value import Value
 from echo import eframe
 from echo.epy_object import safer_repr
 from echo.return_kind import ReturnKind
+from echo.builtin_iter import BUILTIN_ITERATORS_SET
 
 
 DEBUG_PRINT_BYTECODE_LINE = bool(os.getenv('DEBUG_PRINT_BYTECODE_LINE', False))
@@ -40,6 +43,67 @@ GUEST_BUILTINS = {
     str: {'format', 'join'},
 }
 opcodeno = 0
+_DUMP_INDENT = ' ' * 8  # Stack/block lines in ECHO_DUMP_INSTS output.
+
+# Guest builtins used by bytecode handlers; get_guest_builtin is memoized, so
+# these are resolved once here instead of on every execution.
+_TYPE_BUILTIN = get_guest_builtin('type')
+_ISSUBCLASS_BUILTIN = get_guest_builtin('issubclass')
+_ISINSTANCE_BUILTIN = get_guest_builtin('isinstance')
+_STR_BUILTIN = get_guest_builtin('str')
+_REPR_BUILTIN = get_guest_builtin('repr')
+_ITER_BUILTIN = get_guest_builtin('iter')
+_BUILD_CLASS_BUILTIN = get_guest_builtin('__build_class__')
+_DICT_SETITEM_BUILTIN = get_guest_builtin('dict.__setitem__')
+_GETATTR_BUILTIN = get_guest_builtin('getattr')
+_BOOL_BUILTIN = get_guest_builtin('bool')
+_NEXT_BUILTIN = get_guest_builtin('next')
+_BASE_EXCEPTION_BUILTIN = get_guest_builtin('BaseException')
+_TUPLE_BUILTIN = get_guest_builtin('tuple')
+
+# run_binop specialized per binary opcode, see _run_binary.
+_RUN_ADD = interp_routines.make_binop_runner('BINARY_ADD')
+_RUN_OR = interp_routines.make_binop_runner('BINARY_OR')
+_RUN_AND = interp_routines.make_binop_runner('BINARY_AND')
+_RUN_LSHIFT = interp_routines.make_binop_runner('BINARY_LSHIFT')
+_RUN_RSHIFT = interp_routines.make_binop_runner('BINARY_RSHIFT')
+_RUN_SUBTRACT = interp_routines.make_binop_runner('BINARY_SUBTRACT')
+_RUN_SUBSCR = interp_routines.make_binop_runner('BINARY_SUBSCR')
+_RUN_MULTIPLY = interp_routines.make_binop_runner('BINARY_MULTIPLY')
+_RUN_MODULO = interp_routines.make_binop_runner('BINARY_MODULO')
+_RUN_TRUE_DIVIDE = interp_routines.make_binop_runner('BINARY_TRUE_DIVIDE')
+_RUN_FLOOR_DIVIDE = interp_routines.make_binop_runner('BINARY_FLOOR_DIVIDE')
+_RUN_POWER = interp_routines.make_binop_runner('BINARY_POWER')
+
+# Operand types the INPLACE_* ops handle, all by way of the binary runners.
+_INPLACE_NATIVE_TYPES = interp_routines.BUILTIN_VALUE_TYPES | {list}
+
+# Host containers DELETE_SUBSCR deletes from natively; the exact-type set is
+# checked first so the common case skips isinstance.
+_NATIVE_DELITEM_TYPES_TUP = (dict, list, type(os.environ))
+_NATIVE_DELITEM_TYPES = frozenset(_NATIVE_DELITEM_TYPES_TUP)
+
+# Native types whose truthiness the guest sees unchanged, so conditional jumps
+# can test them directly instead of dispatching through the guest `bool`.
+_NATIVE_TRUTH_TYPES = frozenset((
+    type(None), bool, int, float, str, bytes, list, tuple, dict, set,
+))
+
+# Host-version dependent bytecode details, resolved once at import. (The
+# interpreter itself needs a 3.6+ host, so the pre-3.6 encodings of
+# CALL_FUNCTION/MAKE_FUNCTION never apply.)
+_MAP_ADD_VALUE_IS_TOS = sys.version_info[:2] > (3, 7)
+
+_RETURN_VALUE_OPCODE = dis.opmap['RETURN_VALUE']
+_YIELD_VALUE_OPCODE = dis.opmap['YIELD_VALUE']
+
+# Values that must never land on the guest value stack: interpreter-internal
+# wrappers (by type), and native callables/types that would let the guest
+# observe the host rather than the virtualized builtins (by identity).
+_FORBIDDEN_PUSH_TYPES = frozenset((Result, Value))
+_FORBIDDEN_PUSH_IDS = frozenset(id(o) for o in (
+    isinstance, tuple, dict, Exception, BaseException, GuestCoroutine,
+))
 
 
 class WhyStatus(Enum):
@@ -86,6 +150,8 @@ class BlockKind(Enum):
 
 
 class BlockInfo:
+    __slots__ = ('kind', 'handler', 'level')
+
     def __init__(self, kind: BlockKind, handler: int, level: int):
         self.kind = kind
         self.handler = handler
@@ -100,21 +166,32 @@ class BlockInfo:
                                               self.level)
 
 
-def wrap_with_push(frame: 'StatefulFrame', state: InterpreterState,
-                   f: Callable) -> Callable:
-    @functools.wraps(f)
-    def push_wrapper(*args, **kwargs):
+class _FramePusher:
+    """Calls `f` with `frame` installed as the interpreter's last frame.
+
+    A slotted callable rather than a functools.wraps closure, since two of
+    these are made for every frame.
+    """
+    __slots__ = ('frame', 'state', 'f')
+
+    def __init__(self, frame: 'StatefulFrame', state: InterpreterState,
+                 f: Callable):
+        self.frame = frame
+        self.state = state
+        self.f = f
+
+    def __call__(self, *args, **kwargs):
+        state = self.state
+        frame = self.frame
         prior = state.last_frame
         if isinstance(prior, StatefulFrame):
             frame.older_frame = prior
         state.last_frame = frame
         try:
-            return f(*args, **kwargs, ictx=frame.ictx)
+            return self.f(*args, **kwargs, ictx=frame.ictx)
         finally:
             state.last_frame = prior
 
-    return push_wrapper
-
 
 def _sets_pc(f):
     f._sets_pc = True
@@ -130,10 +207,20 @@ class StatefulFrame:
     are subsequently available available to resume later.
     """
 
+    __slots__ = (
+        'code', 'pc', 'stack', 'block_stack', 'pc_to_instruction',
+        'pc_to_bc_width', 'pc_to_step', 'load_method_cache', 'locals_',
+        'locals_dict', 'globals_', 'current_lineno', 'line', 'older_frame',
+        'cellvars', '_cell_get', '_cell_set', 'consts', 'names', 'ictx',
+        'in_function', 'interp_callback', 'do_call_callback',
+    )
+
     def __init__(self,
                  code: types.CodeType,
                  pc_to_instruction: List[Optional[dis.Instruction]],
                  pc_to_bc_width: List[Optional[int]],
+                 pc_to_step: List[Optional['Step']],
+                 load_method_cache: Dict[int, 'LoadMethodEntry'],
                  locals_: List[Any],
                  locals_dict: Optional[Dict[Text, Any]],
                  globals_: Dict[Text, Any],
@@ -148,20 +235,28 @@ class StatefulFrame:
         self.block_stack: List[BlockInfo] = []
         self.pc_to_instruction = pc_to_instruction
         self.pc_to_bc_width = pc_to_bc_width
+        self.pc_to_step = pc_to_step
+        self.load_method_cache = load_method_cache
         self.locals_ = locals_
         self.locals_dict = locals_dict
         self.globals_ = globals_
         self.current_lineno = None  # type: Optional[int]
         self.older_frame = None  # type: Optional[StatefulFrame]
         self.cellvars = cellvars
+        # Bound cell accessors for the DEREF handlers, built only for frames
+        # that have cells so that plain calls don't pay for them.
+        self._cell_get: Sequence[Callable[[], Any]] = (
+            [c.get for c in cellvars] if cellvars else ())
+        self._cell_set: Sequence[Callable[[Any], None]] = (
+            [c.set for c in cellvars] if cellvars else ())
         self.consts = code.co_consts
         self.names = code.co_names
         self.ictx = ictx
         self.in_function = in_function
 
-        self.interp_callback = wrap_with_push(
+        self.interp_callback = _FramePusher(
             self, ictx.interp_state, ictx.interp_callback)
-        self.do_call_callback = wrap_with_push(
+        self.do_call_callback = _FramePusher(
             self, ictx.interp_state, ictx.do_call_callback)
 
     def get_locals_dict(self) -> Optional[Dict[Text, Any]]:
@@ -177,45 +272,41 @@ class StatefulFrame:
         return self.ictx.interp_state
 
     def _etype(self, arg) -> Any:
-        do_type = get_guest_builtin('type')
+        do_type = _TYPE_BUILTIN
         return do_type.invoke((arg,), {}, {}, self.ictx).get_value()
 
     def _eissubclass(self, t0, t1) -> bool:
-        do_issubclass = get_guest_builtin('issubclass')
+        do_issubclass = _ISSUBCLASS_BUILTIN
         r = do_issubclass.invoke((t0, t1), {}, {}, self.ictx).get_value()
         assert isinstance(r, bool)
         return r
 
     def _eisinstance(self, o, t) -> bool:
-        do_issubclass = get_guest_builtin('isinstance')
+        do_issubclass = _ISINSTANCE_BUILTIN
         r = do_issubclass.invoke((o, t), {}, {}, self.ictx).get_value()
         assert isinstance(r, bool)
-        log('fo:eii', f'o {safer_repr(o)} t {safer_repr(t)} => {r}')
+        log('fo:eii', lambda: f'o {safer_repr(o)} t {safer_repr(t)} => {r}')
         return r
 
     def _unwind_except_handler(self, b: BlockInfo) -> None:
         assert b.kind == BlockKind.EXCEPT_HANDLER, b
-        while len(self.stack) > b.level+3:
-            self._pop()
-        ty = self._pop()
-        val = self._pop()
-        tb = self._pop()
+        del self.stack[b.level+3:]
+        tb, val, ty = self._pop3()
         if val is StackNullSentinel:
             exception_data = None
         else:
             exception_data = ExceptionData(parameter=ty, exception=val,
                                            traceback=tb)
-        log('fo:ueh', f'new exception data: {exception_data}')
+        log('fo:ueh', lambda: f'new exception data: {exception_data}')
         self.ictx.exc_info = exception_data
 
     def _unwind_block(self, b: BlockInfo) -> None:
-        while len(self.stack) > b.level:
-            self._pop()
+        del self.stack[b.level:]
 
     def _push_exception_info(
             self, exception_data: Optional[ExceptionData]) -> None:
         if exception_data:
-            log('fo:he', f'exc_info: {self.ictx.exc_info}')
+            log('fo:he', lambda: f'exc_info: {self.ictx.exc_info}')
             self._push(exception_data.traceback)
             self._push(exception_data.exception)
             self._push(exception_data.exception)
@@ -233,32 +324,34 @@ class StatefulFrame:
             When an exception is handled, the PC is set to that of the handler.
         """
         # Pop until we see an except block, or there's no block stack left.
-        log('fo:he', f'handling exception; block stack: {self.block_stack}')
-        while self.block_stack:
+        log('fo:he',
+            lambda: f'handling exception; block stack: {self.block_stack}')
+        block_stack = self.block_stack
+        while block_stack:
+            b = block_stack[-1]
+            kind = b.kind
             if (why == WhyStatus.EXCEPTION
-                    and self.block_stack[-1].kind in (
-                        BlockKind.SETUP_EXCEPT, BlockKind.SETUP_FINALLY)):
+                    and kind in (BlockKind.SETUP_EXCEPT,
+                                 BlockKind.SETUP_FINALLY)):
                 # We wound up at an except block, pop back to the right
                 # value-stack depth and start running the handler.
-                self.pc = self.block_stack[-1].handler
-                self._unwind_block(self.block_stack[-1])
+                self.pc = b.handler
+                self._unwind_block(b)
                 self._push_exception_info(self.ictx.exc_info)
                 self._push_exception_info(exception_data)
                 # The block stack entry transmorgifies into an EXCEPT_HANDLER.
-                self.block_stack[-1].kind = BlockKind.EXCEPT_HANDLER
-                self.block_stack[-1].handler = -1
+                b.kind = BlockKind.EXCEPT_HANDLER
+                b.handler = -1
                 self.ictx.exc_info = exception_data
                 return True
 
-            if (why == WhyStatus.CONTINUE and
-                    self.block_stack[-1].kind == BlockKind.SETUP_LOOP):
-                b = self.block_stack[-1]
+            if why == WhyStatus.CONTINUE and kind == BlockKind.SETUP_LOOP:
                 assert isinstance(return_value, int), return_value
                 self.pc = return_value
                 return True
 
-            if self.block_stack[-1].kind == BlockKind.SETUP_FINALLY:
-                b = self.block_stack.pop()
+            if kind == BlockKind.SETUP_FINALLY:
+                block_stack.pop()
                 self._unwind_block(b)
                 # Not an exception, but we have a finally block to run.
                 if why in (WhyStatus.RETURN, WhyStatus.CONTINUE):
@@ -268,31 +361,30 @@ class StatefulFrame:
                 self.pc = b.handler
                 return True
 
-            if self.block_stack[-1].kind == BlockKind.EXCEPT_HANDLER:
-                self._unwind_except_handler(self.block_stack.pop())
+            if kind == BlockKind.EXCEPT_HANDLER:
+                self._unwind_except_handler(block_stack.pop())
                 continue
 
-            if self.block_stack[-1].kind == BlockKind.SETUP_LOOP:
-                self._unwind_block(self.block_stack.pop())
+            if kind == BlockKind.SETUP_LOOP:
+                self._unwind_block(block_stack.pop())
                 continue
 
-            raise NotImplementedError(self.block_stack[-1])
+            raise NotImplementedError(b)
 
         log('fo:he', 'extinguished block stack without setting PC')
         return False
 
     def _push(self, x: Any) -> None:
-        assert not isinstance(x, Result), x
-        # If the user can observe the real isinstance they can break the
-        # virtualization abstraction, which is undesirable.
-        assert x is not isinstance
-        assert x is not tuple
-        assert x is not dict
-        assert x is not Exception
-        assert x is not BaseException
-        assert not isinstance(x, Value), x
-        assert x is not GuestCoroutine
-        log('fo:stack:push()', lambda: safer_repr(x))
+        if __debug__:
+            # If the user can observe the real isinstance they can break the
+            # virtualization abstraction, which is undesirable.
+            assert (type(x) not in _FORBIDDEN_PUSH_TYPES
+                    and id(x) not in _FORBIDDEN_PUSH_IDS), x
+        # Note: the stack helpers run several times per bytecode, so they test
+        # the debug flag inline rather than paying for a log call (and its
+        # closure) on every push and pop.
+        if elog.ECHO_DEBUG:
+            log('fo:stack:push()', lambda: safer_repr(x))
         self.stack.append(x)
 
     def _push_value(self, x: Value) -> None:
@@ -300,14 +392,43 @@ class StatefulFrame:
 
     def _pop(self) -> Any:
         x = self.stack.pop()
-        log('fo:stack:pop()', lambda: safer_repr(x))
+        if elog.ECHO_DEBUG:
+            log('fo:stack:pop()', lambda: safer_repr(x))
         return x
 
+    def _pop2(self) -> Tuple[Any, Any]:
+        """Pops the top two values, returned as (TOS1, TOS)."""
+        stack = self.stack
+        r = (stack[-2], stack[-1])
+        del stack[-2:]
+        if elog.ECHO_DEBUG:
+            log('fo:stack:pop2()', lambda: safer_repr(r))
+        return r
+
+    def _pop3(self) -> Tuple[Any, Any, Any]:
+        """Pops the top three values, returned as (TOS2, TOS1, TOS)."""
+        stack = self.stack
+        r = (stack[-3], stack[-2], stack[-1])
+        del stack[-3:]
+        if elog.ECHO_DEBUG:
+            log('fo:stack:pop3()', lambda: safer_repr(r))
+        return r
+
+    def _pop_n_list(self, n: int) -> List[Any]:
+        """Pops n values as a fresh list in stack order (TOS last).
+
+        For consumers that only iterate the values, saving _pop_n's tuple copy.
+        """
+        stack = self.stack
+        limit = len(stack)-n
+        result = stack[limit:]
+        del stack[limit:]
+        return result
+
     def _pop_n(self, n: int, tos_is_0: bool = True) -> Tuple[Any, ...]:
-        self.stack, result = (
-            self.stack[:len(self.stack)-n], self.stack[len(self.stack)-n:])
+        result = self._pop_n_list(n)
         if tos_is_0:
-            return tuple(reversed(result))
+            result.reverse()  # The popped list is fresh, reverse it in place.
         return tuple(result)
 
     def _peek(self) -> Any:
@@ -318,10 +439,19 @@ class StatefulFrame:
             return Result(self.globals_[name])
         except KeyError:
             pass
-        res = self.ictx.get_ebuiltins().getattr(name, self.ictx)
+        # Note: builtins lives in a plain EModule, so read its dict directly
+        # (second half of the globals -> builtins chain) and only fall back
+        # to the module's getattr for special attributes and the miss case.
+        ebuiltins = self.ictx.get_ebuiltins()
+        if not ebuiltins.special_attrs:
+            try:
+                return Result(ebuiltins.globals_[name])
+            except KeyError:
+                pass
+        res = ebuiltins.getattr(name, self.ictx)
         if not res.is_exception():
             return res
-        log('bc:globals', f'globals: {self.globals_.keys()}')
+        log('bc:globals', lambda: f'globals: {self.globals_.keys()}')
         return Result(ExceptionData(
             None, None, NameError(f'name {name!r} is not defined')))
 
@@ -334,13 +464,13 @@ class StatefulFrame:
         if (arg & 0x3) == 0:  # Value is formatted as-is.
             pass
         elif (arg & 0x3) == 1:  # Call str on value before formatting.
-            s = get_guest_builtin('str')
+            s = _STR_BUILTIN
             res = s.invoke((value,), {}, {}, self.ictx)
             if res.is_exception():
                 return res
             value = res.get_value()
         elif (arg & 0x3) == 2:  # Call repr on value before formatting.
-            s = get_guest_builtin('repr')
+            s = _REPR_BUILTIN
             res = s.invoke((value,), {}, {}, self.ictx)
             if res.is_exception():
                 return res
@@ -349,7 +479,7 @@ class StatefulFrame:
         return Result(format(value, fmt_spec))
 
     def _run_BUILD_STRING(self, arg, argval) -> Result[str]:
-        pieces = self._pop_n(arg, tos_is_0=False)
+        pieces = self._pop_n_list(arg)
         return Result(''.join(pieces))
 
     def _run_POP_TOP(self, arg, argval) -> None:
@@ -408,9 +538,9 @@ class StatefulFrame:
         self.block_stack.pop()
 
     def _run_DELETE_SUBSCR(self, arg, argval):
-        tos = self._pop()
-        tos1 = self._pop()
-        if isinstance(tos1, (dict, list, type(os.environ))):
+        tos1, tos = self._pop2()
+        if (type(tos1) in _NATIVE_DELITEM_TYPES
+                or isinstance(tos1, _NATIVE_DELITEM_TYPES_TUP)):
             try:
                 del tos1[tos]
             except KeyError as e:
@@ -421,15 +551,17 @@ class StatefulFrame:
         else:
             raise NotImplementedError(tos, tos1)
 
-    def _run_LOAD_CONST(self, arg, argval) -> Result[Any]:
-        return Result(self.consts[arg])
+    def _run_LOAD_CONST(self, arg, argval) -> None:
+        # Note: pushes directly rather than returning a Result for the
+        # dispatch loop to unwrap and push, this is among the hottest ops.
+        self.stack.append(self.consts[arg])
 
     def _run_GET_ITER(self, arg, argval) -> Result[Any]:
-        do_iter = get_guest_builtin('iter')
+        do_iter = _ITER_BUILTIN
         return do_iter.invoke((self._pop(),), {}, {}, self.ictx)
 
     def _run_LOAD_BUILD_CLASS(self, arg, argval):
-        return Result(get_guest_builtin('__build_class__'))
+        return Result(_BUILD_CLASS_BUILTIN)
 
     def _run_BUILD_TUPLE(self, arg, argval):
         count = arg
@@ -437,41 +569,40 @@ class StatefulFrame:
         return Result(t)
 
     def _run_BUILD_TUPLE_UNPACK(self, arg, argval) -> Result[Any]:
-        iterables = self._pop_n(arg, tos_is_0=False)
-        return Result(tuple(itertools.chain(*iterables)))
+        iterables = self._pop_n_list(arg)
+        return Result(tuple(itertools.chain.from_iterable(iterables)))
 
     def _run_BUILD_TUPLE_UNPACK_WITH_CALL(self, arg, argval) -> Result[Any]:
         return self._run_BUILD_TUPLE_UNPACK(arg, argval)
 
     def _run_BUILD_LIST(self, arg, argval):
-        count = arg
-        limit = len(self.stack)-count
-        self.stack, t = self.stack[:limit], self.stack[limit:]
-        return Result(t)
+        return Result(self._pop_n_list(arg))
 
     def _run_BUILD_MAP(self, arg, argval):
-        items = self._pop_n(2 * arg, tos_is_0=False)
-        ks = items[::2]
-        vs = items[1::2]
-        return Result(dict(zip(ks, vs)))
+        stack = self.stack
+        base = len(stack) - 2 * arg
+        d = {}
+        for i in range(base, len(stack), 2):
+            d[stack[i]] = stack[i+1]
+        del stack[base:]
+        return Result(d)
 
     def _run_MAP_ADD(self, arg, argval) -> None:
-        if sys.version_info[:2] > (3, 7):
-            v = self._pop()
-            k = self._pop()
+        if _MAP_ADD_VALUE_IS_TOS:
+            k, v = self._pop2()
         else:
-            k = self._pop()
-            v = self._pop()
+            v, k = self._pop2()
         map_ = self.stack[-arg]
         assert isinstance(map_, dict), map_
-        si = get_guest_builtin('dict.__setitem__')
+        si = _DICT_SETITEM_BUILTIN
         si.invoke((map_, k, v), {}, {}, self.ictx)
 
     def _run_BUILD_SET(self, arg, argval):
-        count = arg
-        limit = len(self.stack)-count
-        self.stack, t = self.stack[:limit], self.stack[limit:]
-        return Result(set(t))
+        stack = self.stack
+        limit = len(stack)-arg
+        t = set(stack[limit:])
+        del stack[limit:]
+        return Result(t)
 
     def _run_BUILD_SLICE(self, arg, argval):
         step = self._pop() if arg == 3 else None
@@ -480,18 +611,22 @@ class StatefulFrame:
         return Result(slice(start, stop, step))
 
     def _run_BUILD_CONST_KEY_MAP(self, arg, argval):
-        count = arg
         ks = self._pop()
-        self.stack, vs = self.stack[:-count], tuple(self.stack[-count:])
+        stack = self.stack
+        limit = len(stack)-arg
+        vs = stack[limit:]
+        del stack[limit:]
         assert len(ks) == len(vs)
         return Result(dict(zip(ks, vs)))
 
     def _run_ROT_TWO(self, arg, argval):
-        self.stack[-1], self.stack[-2] = self.stack[-2], self.stack[-1]
+        stack = self.stack
+        stack[-1], stack[-2] = stack[-2], stack[-1]
 
     def _run_DUP_TOP(self, arg, argval):
-        assert self.stack, 'Cannot DUP_TOP of empty stack.'
-        self.stack = self.stack + self.stack[-1:]
+        stack = self.stack
+        assert stack, 'Cannot DUP_TOP of empty stack.'
+        stack.append(stack[-1])
 
     def _run_POP_EXCEPT(self, arg, argval):
         self._unwind_except_handler(self.block_stack.pop())
@@ -501,8 +636,7 @@ class StatefulFrame:
         # delta points to the finally block."
         # -- https://docs.python.org/3.7/library/dis.html#opcode-SETUP_FINALLY
         self.block_stack.append(BlockInfo(
-            BlockKind.SETUP_FINALLY, arg+self.pc+self.pc_to_bc_width[self.pc],
-            len(self.stack)))
+            BlockKind.SETUP_FINALLY, argval, len(self.stack)))
 
     def _run_DELETE_NAME(self, arg, argval):
         log('fo:dn', f'argval: {argval} code.co_names: {self.code.co_names} '
@@ -516,28 +650,30 @@ class StatefulFrame:
             del self.globals_[argval]
 
     def _run_DUP_TOP_TWO(self, arg, argval):
-        self.stack = self.stack + self.stack[-2:]
+        stack = self.stack
+        stack.append(stack[-2])
+        stack.append(stack[-2])
 
     def _run_ROT_THREE(self, arg, argval):
         #                                  old first  old second  old third
-        self.stack[-3], self.stack[-1], self.stack[-2] = (
-            self.stack[-1], self.stack[-2], self.stack[-3])
+        stack = self.stack
+        stack[-3], stack[-1], stack[-2] = stack[-1], stack[-2], stack[-3]
 
     def _run_LOAD_DEREF(self, arg, argval):
-        return Result(self.cellvars[arg].get())
+        return Result(self._cell_get[arg]())
 
     def _run_STORE_DEREF(self, arg, argval):
-        self.cellvars[arg].set(self._pop())
+        self._cell_set[arg](self._pop())
 
     def _run_STORE_FAST(self, arg, argval):
-        self.locals_[arg] = self._pop()
+        self.locals_[arg] = self.stack.pop()
 
     def _run_LOAD_CLOSURE(self, arg, argval):
         return Result(self.cellvars[arg])
 
     def _run_SETUP_WITH(self, arg, argval) -> Result[Any]:
         mgr = self._peek()
-        do_getattr = get_guest_builtin('getattr')
+        do_getattr = _GETATTR_BUILTIN
         enter = do_getattr.invoke((mgr, '__enter__'), {}, {}, self.ictx)
         if enter.is_exception():
             return enter
@@ -608,11 +744,16 @@ class StatefulFrame:
 
     @_sets_pc
     def _run_JUMP_FORWARD(self, arg, argval):
-        self.pc += arg + self.pc_to_bc_width[self.pc]
+        # Note: dis resolves relative jumps, so argval is already the target.
+        self.pc = argval
         return True
 
+    # Note: the truth helpers are the slow path through the guest `bool`;
+    # their callers test _NATIVE_TRUTH_TYPES inline first, since the
+    # conditional jumps run on every branch.
+
     def _is_truthy(self, o: Any) -> Result[bool]:
-        do_bool = get_guest_builtin('bool')
+        do_bool = _BOOL_BUILTIN
         return do_bool.invoke((o,), {}, {}, self.ictx)
 
     def _is_falsy(self, o: Any) -> Result[bool]:
@@ -625,44 +766,53 @@ class StatefulFrame:
 
     @_sets_pc
     def _run_POP_JUMP_IF_FALSE(self, arg, argval) -> bool:
-        v = self._pop()
-        if self._is_falsy(v).get_value():
-            log('bc:pjif', f'jumping on falsy: {v}')
+        v = self.stack.pop()
+        if (not v if type(v) in _NATIVE_TRUTH_TYPES
+                else self._is_falsy(v).get_value()):
+            log('bc:pjif', lambda: f'jumping on falsy: {v}')
             self.pc = arg
             return True
-        log('bc:pjif', f'not jumping, truthy: {v}')
+        log('bc:pjif', lambda: f'not jumping, truthy: {v}')
         return False
 
     @_sets_pc
     def _run_POP_JUMP_IF_TRUE(self, arg, argval):
-        v = self._pop()
-        if self._is_truthy(v).get_value():
-            log('bc:pjit', f'jumping on truthy: {v}')
+        v = self.stack.pop()
+        if (v if type(v) in _NATIVE_TRUTH_TYPES
+                else self._is_truthy(v).get_value()):
+            log('bc:pjit', lambda: f'jumping on truthy: {v}')
             self.pc = arg
             return True
-        log('bc:pjit', f'not jumping, falsy: {v}')
+        log('bc:pjit', lambda: f'not jumping, falsy: {v}')
         return False
 
     @_sets_pc
     def _run_JUMP_IF_FALSE_OR_POP(self, arg, argval):
-        if self._is_falsy(self._peek()).get_value():
+        v = self.stack[-1]
+        if (not v if type(v) in _NATIVE_TRUTH_TYPES
+                else self._is_falsy(v).get_value()):
             self.pc = arg
             return True
         else:
-            self._pop()
+            self.stack.pop()
             return False
 
     @_sets_pc
     def _run_JUMP_IF_TRUE_OR_POP(
             self, arg, argval) -> Union[bool, Result[Any]]:
-        res = self._is_truthy(self._peek())
-        if res.is_exception():
-            return res
-        if res.get_value():
+        v = self.stack[-1]
+        if type(v) in _NATIVE_TRUTH_TYPES:
+            truthy = bool(v)
+        else:
+            res = self._is_truthy(v)
+            if res.is_exception():
+                return res
+            truthy = res.get_value()
+        if truthy:
             self.pc = arg
             return True
         else:
-            self._pop()
+            self.stack.pop()
             return False
 
     @_sets_pc
@@ -683,13 +833,27 @@ class StatefulFrame:
     @_sets_pc
     def _run_FOR_ITER(self, arg, argval):
         o = self._peek()
-        do_next = get_guest_builtin('next')
-        r = do_next.invoke((o,), {}, {}, self.ictx)
-        log('bc:for_iter', f'o: {o} r: {r}')
-        if (r.is_exception()
-                and isinstance(r.get_exception().exception, StopIteration)):
+        if type(o) in BUILTIN_ITERATORS_SET:
+            # Host iterators are stepped directly rather than via the guest
+            # `next` builtin, which would do the same after a dispatch.
+            try:
+                v = next(o)
+            except StopIteration:
+                exhausted = True
+            else:
+                exhausted = False
+        else:
+            r = _NEXT_BUILTIN.invoke((o,), {}, {}, self.ictx)
+            log('bc:for_iter', lambda: f'o: {o} r: {r}')
+            exhausted = (r.is_exception() and isinstance(
+                r.get_exception().exception, StopIteration))
+            if not exhausted:
+                assert not r.is_exception(), r
+                v = r.get_value()
+
+        if exhausted:
             self._pop()  # Pop the extinguished iterator, break the loop.
-            self.pc += self.pc_to_bc_width[self.pc] + arg
+            self.pc = argval
             new_instruction = self.pc_to_instruction[self.pc]
             assert new_instruction is not None
             assert new_instruction.is_jump_target, (
@@ -697,11 +861,10 @@ class StatefulFrame:
                 self.pc_to_instruction[self.pc])
             return True
 
-        assert not r.is_exception(), r
-        self._push(r.get_value())
+        self._push(v)
 
     def _run_MAKE_FUNCTION(self, arg: int, argval) -> Result[EFunction]:
-        mfd = bc_helpers.do_MAKE_FUNCTION(self._pop, arg, sys.version_info)
+        mfd = bc_helpers.do_MAKE_FUNCTION_36(self._pop, arg)
         f = EFunction(mfd.code, self.globals_, mfd.qualified_name,
                       defaults=mfd.positional_defaults,
                       kwarg_defaults=(None if mfd.kwarg_defaults is None
@@ -709,10 +872,12 @@ class StatefulFrame:
                       closure=mfd.freevar_cells)
         return Result(f)
 
-    def _run_CALL_FUNCTION(self, arg, argval):
-        fpop_n = functools.partial(self._pop_n, tos_is_0=False)
-        f, args, kwargs = bc_helpers.do_CALL_FUNCTION(fpop_n, arg,
-                                                      sys.version_info)
+    def _run_CALL_FUNCTION(self, arg: int, argval: Any) -> Result[Any]:
+        # https://docs.python.org/3.7/library/dis.html#opcode-CALL_FUNCTION
+        # -- positional arguments only as of 3.6.
+        args = self._pop_n(arg, tos_is_0=False)
+        f = self._pop()
+        kwargs: Dict[Text, Any] = {}
         log('bc:call',
             lambda: f'{self.code.co_filename}:{self.current_lineno} f: {f} '
                     f'args: {args}')
@@ -738,7 +903,7 @@ class StatefulFrame:
     def _run_STORE_ATTR(self, arg, argval) -> Result[Any]:
         obj = self._pop()
         value = self._pop()
-        log('bc:sa', f'obj {obj!r} attr {argval!r} val {value!r}')
+        log('bc:sa', lambda: f'obj {obj!r} attr {argval!r} val {value!r}')
         r = do_setattr((obj, argval, value), {}, self.ictx)
         if r.is_exception():
             return r
@@ -757,12 +922,14 @@ class StatefulFrame:
                       closure=freevar_cells)
         return Result(f)
 
-    def _run_LOAD_FAST(self, arg, argval) -> Result[Any]:
+    def _run_LOAD_FAST(self, arg, argval) -> Optional[Result[Any]]:
         v = self.locals_[arg]
         if v is UnboundLocalSentinel:
             msg = 'name {!r} is not defined'.format(argval)
             return Result(ExceptionData(None, None, NameError(msg)))
-        return Result(v)
+        # Note: pushes directly, as in LOAD_CONST.
+        self.stack.append(v)
+        return None
 
     def _run_DELETE_FAST(self, arg, argval) -> None:
         self.locals_[arg] = UnboundLocalSentinel
@@ -810,8 +977,7 @@ class StatefulFrame:
         return r
 
     def _run_COMPARE_OP(self, arg, argval):
-        rhs = self._pop()
-        lhs = self._pop()
+        lhs, rhs = self._pop2()
         if argval == 'exception match':
             return interp_routines.exception_match(lhs, rhs, self.ictx)
         else:
@@ -836,7 +1002,7 @@ class StatefulFrame:
                 return Result(True)
 
             raise NotImplementedError(status)
-        elif (self._eissubclass(status, get_guest_builtin('BaseException'))
+        elif (self._eissubclass(status, _BASE_EXCEPTION_BUILTIN)
               or isinstance(status, BaseException)):
             exc = self._pop()
             tb = self._pop()
@@ -851,8 +1017,9 @@ class StatefulFrame:
                 f'Unhandled END_FINALLY status: {status!r}')
 
     def _run_UNARY_NOT(self, arg, argval) -> None:
-        arg = self._pop()
-        self._push(self._is_falsy(arg).get_value())
+        v = self.stack.pop()
+        self.stack.append(not v if type(v) in _NATIVE_TRUTH_TYPES
+                          else self._is_falsy(v).get_value())
 
     def _run_UNARY_INVERT(self, arg, argval) -> Result[Any]:
         arg = self._pop()
@@ -866,102 +1033,98 @@ class StatefulFrame:
         arg = self._pop()
         return interp_routines.run_unop('UNARY_POSITIVE', arg, self.ictx)
 
-    def _run_binary(self, opname) -> Result[Any]:
-        rhs = self._pop()
-        lhs = self._pop()
-        return interp_routines.run_binop(
-            opname, lhs, rhs, self.ictx)
+    def _run_binary(self, run_binop: Callable[[Any, Any, ICtx], Result[Any]]
+                    ) -> Result[Any]:
+        lhs, rhs = self._pop2()
+        return run_binop(lhs, rhs, self.ictx)
 
     def _run_BINARY_ADD(self, arg, argval):
-        return self._run_binary('BINARY_ADD')
+        return self._run_binary(_RUN_ADD)
 
     def _run_BINARY_OR(self, arg, argval):
-        return self._run_binary('BINARY_OR')
+        return self._run_binary(_RUN_OR)
 
     def _run_BINARY_AND(self, arg, argval):
-        return self._run_binary('BINARY_AND')
+        return self._run_binary(_RUN_AND)
 
     def _run_BINARY_LSHIFT(self, arg, argval):
-        return self._run_binary('BINARY_LSHIFT')
+        return self._run_binary(_RUN_LSHIFT)
 
     def _run_BINARY_RSHIFT(self, arg, argval):
-        return self._run_binary('BINARY_RSHIFT')
+        return self._run_binary(_RUN_RSHIFT)
 
     def _run_BINARY_SUBTRACT(self, arg, argval):
-        return self._run_binary('BINARY_SUBTRACT')
+        return self._run_binary(_RUN_SUBTRACT)
 
     def _run_BINARY_SUBSCR(self, arg, argval):
-        return self._run_binary('BINARY_SUBSCR')
+        return self._run_binary(_RUN_SUBSCR)
 
     def _run_BINARY_MULTIPLY(self, arg, argval):
-        return self._run_binary('BINARY_MULTIPLY')
+        return self._run_binary(_RUN_MULTIPLY)
 
     def _run_BINARY_MODULO(self, arg, argval):
-        return self._run_binary('BINARY_MODULO')
+        return self._run_binary(_RUN_MODULO)
 
     def _run_BINARY_TRUE_DIVIDE(self, arg, argval):
-        return self._run_binary('BINARY_TRUE_DIVIDE')
+        return self._run_binary(_RUN_TRUE_DIVIDE)
 
     def _run_BINARY_FLOOR_DIVIDE(self, arg, argval):
-        return self._run_binary('BINARY_FLOOR_DIVIDE')
+        return self._run_binary(_RUN_FLOOR_DIVIDE)
 
     def _run_BINARY_POWER(self, arg, argval):
-        return self._run_binary('BINARY_POWER')
-
-    def _run_INPLACE(self, subopcode: Text, arg, argval) -> Result[Any]:
-        rhs = self._pop()
-        lhs = self._pop()
-        if ({type(lhs), type(rhs)} <=
-                interp_routines.BUILTIN_VALUE_TYPES | {list}):
-            return interp_routines.run_binop(
-                'BINARY_' + subopcode, lhs, rhs, self.ictx)
+        return self._run_binary(_RUN_POWER)
+
+    def _run_INPLACE(self, run_binop: Callable[[Any, Any, ICtx], Result[Any]]
+                     ) -> Result[Any]:
+        lhs, rhs = self._pop2()
+        if (type(lhs) in _INPLACE_NATIVE_TYPES
+                and type(rhs) in _INPLACE_NATIVE_TYPES):
+            return run_binop(lhs, rhs, self.ictx)
         else:
             raise NotImplementedError(lhs, rhs)
 
     def _run_INPLACE_OR(self, arg, argval):
-        return self._run_INPLACE('OR', arg, argval)
+        return self._run_INPLACE(_RUN_OR)
 
     def _run_INPLACE_AND(self, arg, argval):
-        return self._run_INPLACE('AND', arg, argval)
+        return self._run_INPLACE(_RUN_AND)
 
     def _run_INPLACE_ADD(self, arg, argval):
-        return self._run_INPLACE('ADD', arg, argval)
+        return self._run_INPLACE(_RUN_ADD)
 
     def _run_INPLACE_SUBTRACT(self, arg, argval):
-        return self._run_INPLACE('SUBTRACT', arg, argval)
+        return self._run_INPLACE(_RUN_SUBTRACT)
 
     def _run_SETUP_EXCEPT(self, arg, argval):
         self.block_stack.append(BlockInfo(
-            BlockKind.SETUP_EXCEPT, arg+self.pc+self.pc_to_bc_width[self.pc],
-            len(self.stack)))
+            BlockKind.SETUP_EXCEPT, argval, len(self.stack)))
 
     def _run_STORE_SUBSCR(self, arg, argval) -> Result[Any]:
-        tos = self._pop()
-        tos1 = self._pop()
-        tos2 = self._pop()
+        tos2, tos1, tos = self._pop3()
         r = do_setitem((tos1, tos, tos2), self.ictx)
         if r.is_exception():
             return r
         return Result(NoStackPushSentinel)
 
     def _run_CALL_FUNCTION_KW(self, arg, argval):
-        args = arg
         kwarg_names = self._pop()
-        kwarg_values = self._pop_n(len(kwarg_names), tos_is_0=False)
-        assert len(kwarg_names) == len(kwarg_values), (
-            kwarg_names, kwarg_values)
-        kwargs = dict(zip(kwarg_names, kwarg_values))
-        rest = args-len(kwargs)
-        args = self._pop_n(rest, tos_is_0=False)
-        to_call = self._pop()
+        stack = self.stack
+        # Stack is `[..., callable, *positional, *kwarg_values]` where the
+        # positional and keyword values together number `arg`.
+        kwarg_start = len(stack)-len(kwarg_names)
+        callable_index = len(stack)-arg-1
+        kwargs = dict(zip(kwarg_names, stack[kwarg_start:]))
+        assert len(kwargs) == len(kwarg_names), (kwarg_names, stack)
+        args = tuple(stack[callable_index+1:kwarg_start])
+        to_call = stack[callable_index]
+        del stack[callable_index:]
         return self.do_call_callback(
             to_call, args, kwargs, self.locals_dict,
             globals_=self.globals_)
 
     def _run_SETUP_LOOP(self, arg, argval):
         self.block_stack.append(BlockInfo(
-            BlockKind.SETUP_LOOP, arg + self.pc + self.pc_to_bc_width[self.pc],
-            len(self.stack)))
+            BlockKind.SETUP_LOOP, argval, len(self.stack)))
 
     @_sets_pc
     def _run_CONTINUE_LOOP(self, arg, argval) -> bool:
@@ -985,11 +1148,11 @@ class StatefulFrame:
         if exc is _Sentinel:  # Re-raise.
             return Result(self.ictx.exc_info)
 
-        log('bc:rv', f'RAISE_VARARGS exc {safer_repr(exc)}')
+        log('bc:rv', lambda: f'RAISE_VARARGS exc {safer_repr(exc)}')
         if (isinstance(exc, type) and issubclass(exc, BaseException)):
             ty = exc
             exc = ty()
-        elif self._eisinstance(exc, get_guest_builtin('BaseException')):
+        elif self._eisinstance(exc, _BASE_EXCEPTION_BUILTIN):
             ty = self._etype(exc)
         else:
             ty = TypeError
@@ -1001,46 +1164,88 @@ class StatefulFrame:
         # Note: New in 3.7. See also _run_CALL_METHOD
         #
         # https://docs.python.org/3.7/library/dis.html#opcode-LOAD_METHOD
+        #
+        # As in CPython the stack ends up as `[method, self_or_null]`, so that
+        # CALL_METHOD finds self directly beneath the positional arguments
+        # and can slice them off together instead of building a second tuple.
         obj = self._peek()
+        if type(obj) is EInstance:
+            entry = self.load_method_cache.get(self.pc)
+            if (entry is not None and entry[0] is obj.cls
+                    and entry[1] == EClass.dict_epoch
+                    and argval not in obj.dict_):
+                # Cache hit: push the plain function with obj as its self
+                # rather than materializing a bound method.
+                stack = self.stack
+                stack[-1] = entry[2]
+                stack.append(obj)
+                return None
+
         desc_count_before = self.ictx.desc_count
         attr_result = self._run_LOAD_ATTR(arg, argval)
         if attr_result.is_exception():
             return attr_result
-        log('bc:lm', f'LOAD_ATTR obj {obj!r} argval {argval} => {attr_result}')
+        log('bc:lm', lambda: f'LOAD_ATTR obj {obj!r} argval {argval} => '
+                             f'{attr_result}')
+        value = attr_result.get_value()
+        self._push(value)
         if (desc_count_before == self.ictx.desc_count
                 and interp_routines.method_requires_self(
-                    obj=obj, name=argval, value=attr_result.get_value(),
-                    ictx=self.ictx)):
+                    obj=obj, name=argval, value=value, ictx=self.ictx)):
             self._push(obj)
         else:
             self._push(StackNullSentinel)
-        self._push(attr_result.get_value())
+            if type(obj) is EInstance:
+                self._cache_load_method(obj, argval, value)
+
+    def _cache_load_method(self, obj: EInstance, name: Text,
+                           value: Any) -> None:
+        """Records this LOAD_METHOD site in load_method_cache if `value` is
+        a plain guest function from obj's class, bound to obj."""
+        if (type(value) is not EMethod or value.bound_self is not obj
+                or type(value.f) is not EFunction or name in obj.dict_):
+            return
+        cls = obj.cls
+        if type(cls) is not EClass:
+            return
+        for c in cls.get_mro():
+            if type(c) is not EClass:
+                return  # Builtin bases resolve attributes differently.
+            if name in c.dict_:
+                if c.dict_[name] is value.f:
+                    self.load_method_cache[self.pc] = (
+                        cls, EClass.dict_epoch, value.f)
+                return
 
     def _run_CALL_METHOD(self, arg, argval):
         # Note: new in 3.7. See also _run_LOAD_METHOD
         #
         # https://docs.python.org/3.7/library/dis.html#opcode-CALL_METHOD
         positional_argc = arg
-        args = self._pop_n(positional_argc, tos_is_0=False)
-        method = self._pop()
-        self_value = self._pop()
-        if self_value is not StackNullSentinel:
-            args = (self_value,) + args
+        stack = self.stack
+        # Stack is `[..., method, self_or_null, *positional]`; the arguments
+        # (with self, when present) are one slice and everything from the
+        # method up goes in a single delete.
+        method_index = len(stack)-positional_argc-2
+        if stack[method_index+1] is StackNullSentinel:
+            args = tuple(stack[method_index+2:])
+        else:
+            args = tuple(stack[method_index+1:])
+        method = stack[method_index]
+        del stack[method_index:]
         log('bc:cm', lambda: f'method: {method}')
         log('bc:cm', lambda: f'args: {args}')
-        log('bc:cm', lambda: f'self_value: {self_value}')
         return self.do_call_callback(
             method, args, {}, self.locals_dict,
             globals_=self.globals_)
 
     def _run_CALL_FUNCTION_EX(self, arg, argval):
-        if arg & 0x1:
-            kwargs = self._pop()
-        else:
-            kwargs = None
+        kwargs = self._pop() if arg & 0x1 else None
         callargs = self._pop()
-        if not isinstance(callargs, tuple):
-            do_tuple = get_guest_builtin('tuple')
+        # Note: exact type check, as CPython does, so tuple subclasses are
+        # coerced too.
+        if type(callargs) is not tuple:
+            do_tuple = _TUPLE_BUILTIN
             callargs = do_tuple.invoke((callargs,), {}, {}, self.ictx)
             if callargs.is_exception():
                 return callargs
@@ -1067,13 +1272,21 @@ class StatefulFrame:
 
     def _run_UNPACK_EX(self, arg, argval):
         tos = self._pop()
-        do_iter = get_guest_builtin('iter')
+        do_iter = _ITER_BUILTIN
         it = do_iter.invoke((tos,), {}, {}, self.ictx)
         if it.is_exception():
             return it
         it = it.get_value()
+        if type(it) in BUILTIN_ITERATORS_SET:
+            # Host iterators are drained natively, as in FOR_ITER.
+            stack_values = list(itertools.islice(it, arg))
+            if len(stack_values) < arg:
+                return Result(ExceptionData(None, None, StopIteration()))
+            stack_values.append(list(it))
+            self.stack.extend(reversed(stack_values))
+            return None
         stack_values = []
-        do_next = get_guest_builtin('next')
+        do_next = _NEXT_BUILTIN
         for _ in range(arg):
             r = do_next.invoke((it,), {}, {}, self.ictx)
             if r.is_exception():
@@ -1090,13 +1303,19 @@ class StatefulFrame:
                 return r
             rest.append(r.get_value())
         stack_values.append(rest)
-        for item in reversed(stack_values):
-            self._push(item)
+        self.stack.extend(reversed(stack_values))
+        return None
 
     def _run_UNPACK_SEQUENCE(self, arg, argval) -> Optional[Result[None]]:
         # https://docs.python.org/3.7/library/dis.html#opcode-UNPACK_SEQUENCE
         t = self._pop()
 
+        if type(t) in (tuple, list) and len(t) == arg:
+            # Host tuples/lists of the right length unpack natively instead of
+            # going through the guest iteration protocol one item at a time.
+            self.stack.extend(reversed(t))
+            return None
+
         seen = []
 
         def cb(item: Any) -> Result[bool]:
@@ -1107,144 +1326,62 @@ class StatefulFrame:
         if res.is_exception():
             return res
 
-        for item in reversed(seen):
-            self._push(item)
-
+        self.stack.extend(reversed(seen))
         return None
 
     def _run_EXTENDED_ARG(self, arg, argval):
         pass  # The to-instruction decoding step already extended the args?
 
-    def _dump_inst(self, instruction: dis.Instruction) -> None:
+    def _dump_inst(self, instruction: dis.Instruction, mode: Text) -> None:
+        """Prints instruction (and the stack) per the ECHO_DUMP_INSTS mode."""
         global opcodeno
+        stderr = sys.stderr
         if instruction.starts_line:
             print(f'{self.code.co_filename}:{instruction.starts_line}'
                   f' :: {self.code.co_name}',
-                  file=sys.stderr)
-        if os.getenv('ECHO_DUMP_INSTS') == 'lines':
+                  file=stderr)
+        if mode == 'lines':
             return
-        print('{:5d} :: {:3d} {}'.format(
-            opcodeno,
-            instruction.offset,
-            trace_util.remove_at_hex(str(instruction))), file=sys.stderr)
+        print(f'{opcodeno:5d} :: {instruction.offset:3d} '
+              f'{trace_util.remove_at_hex(str(instruction))}', file=stderr)
         opcodeno += 1
         if (instruction.opname == 'EXTENDED_ARG' or
-                os.getenv('ECHO_DUMP_INSTS') == 'nostack'):
+                mode == 'nostack'):
             return
-        print(' ' * 8, ' stack ({}):{}'.format(len(self.stack),
-              ' empty' if len(self.stack) == 0 else ''), file=sys.stderr)
-        for i, item in enumerate(reversed(self.stack)):
+        stack = self.stack
+        print(_DUMP_INDENT,
+              f' stack ({len(stack)}):{" empty" if not stack else ""}',
+              file=stderr)
+        for i, item in enumerate(reversed(stack)):
             item_type = self._etype(item)
             if (isinstance(item, EPyObject) or
                     isinstance(item, (types.FunctionType, types.CodeType,
                                       types.BuiltinFunctionType, type, bool,
                                       int, str, list, dict, type(None),
                                       Exception))):
-                s = '{!r} :: {}'.format(
-                    item_type, trace_util.remove_at_hex(repr(item)))
+                s = (f'{item_type!r} :: '
+                     f'{trace_util.remove_at_hex(repr(item))}')
             else:
                 s = repr(item_type)
             if item is StackNullSentinel:
                 s = '<null>'
-            print(' ' * 8, '  TOS{}: {}'.format(i, s), file=sys.stderr)
+            print(_DUMP_INDENT, f'  TOS{i}: {s}', file=stderr)
 
         if self.block_stack:
-            print(' ' * 8, 'f_iblock: {}'.format(len(self.block_stack)),
-                  file=sys.stderr)
+            print(_DUMP_INDENT, f'f_iblock: {len(self.block_stack)}',
+                  file=stderr)
             for i, block_info in enumerate(self.block_stack):
-                print(' ' * 9,
-                      'blockstack {}: type: {} handler: {} level: {}'
-                      .format(
-                        i, block_info.kind.value, block_info.handler,
-                        block_info.level), file=sys.stderr)
-
-    def _run_one_bytecode(self) -> Optional[Result[Tuple[Value, ReturnKind]]]:
-        instruction: Optional[dis.Instruction] = \
-            self.pc_to_instruction[self.pc]
-        assert instruction is not None, (self.pc_to_instruction, self.pc)
-
-        if instruction.starts_line:
-            self.current_lineno = instruction.starts_line
-            log('bc:line',
-                f'{self.code.co_filename}:{instruction.starts_line}')
-
-        log('bc:inst', lambda: str(instruction))
-        if os.getenv('ECHO_DUMP_INSTS'):
-            self._dump_inst(instruction)
-
-        if instruction.starts_line is not None:
-            self.line = instruction.starts_line
-
-        if instruction.opname == 'RETURN_VALUE':
-            v = Value(self._pop())
-            log('bc:rv', repr(v))
-            return Result((v, ReturnKind.RETURN))
-
-        if instruction.opname == 'YIELD_VALUE':
-            yield_width: Optional[int] = self.pc_to_bc_width[self.pc]
-            assert yield_width is not None
-            self.pc += yield_width
-            return Result((Value(self._peek()), ReturnKind.YIELD))
-
-        f = getattr(self, '_run_{}'.format(instruction.opname))
-        f_sets_pc = getattr(f, '_sets_pc', False)
-
-        stack_depth_before = len(self.stack)
-        result = f(arg=instruction.arg, argval=instruction.argval)
-        log('bc:res', lambda: f'result {result}')
-        if result is None or type(result) is bool:
-            pass
-        else:
-            assert isinstance(result, Result), (
-                'Bytecode must return Result', instruction, 'got', result)
-            if result.is_exception():
-                exception_data = result.get_exception()
-                if not exception_data.traceback:
-                    exception_data.traceback = etraceback.ETraceback(
-                        eframe.EFrame(self), self.pc, self.line)
-                if self._handle_exception(WhyStatus.EXCEPTION, exception_data,
-                                          _Sentinel):
-                    return None
-                else:
-                    return result
-            elif isinstance(result.get_value(), Value):
-                self._push_value(result.get_value())
-            elif (not f_sets_pc and
-                    result.get_value() is not NoStackPushSentinel):
-                self._push(result.get_value())
-
-        stack_depth_after = len(self.stack)
-        if instruction.opname not in (
-                # These opcodes claim a value-stack effect, but we use a
-                # different stack for block info.
-                'SETUP_EXCEPT', 'POP_EXCEPT', 'SETUP_FINALLY', 'END_FINALLY',
-                'SETUP_WITH', 'WITH_CLEANUP_START', 'WITH_CLEANUP_FINISH',
-                'CONTINUE_LOOP',
-                # This op causes the stack_effect call to error.
-                'EXTENDED_ARG', 'BREAK_LOOP',
-                # These ops may or may not pop the stack.
-                'JUMP_IF_FALSE_OR_POP', 'JUMP_IF_TRUE_OR_POP', 'FOR_ITER',
-                ):
-            stack_effect = dis.stack_effect(instruction.opcode,
-                                            instruction.arg)
-            assert stack_depth_after-stack_depth_before == stack_effect, (
-                instruction, stack_depth_after, stack_depth_before,
-                stack_effect)
-
-        if ((not f_sets_pc) or
-                (f_sets_pc and not self._maybe_box_result_truthy(result))):
-            width: Optional[int] = self.pc_to_bc_width[self.pc]
-            assert width is not None
-            self.pc += width
-
-        return None
+                print(_DUMP_INDENT + ' ',
+                      f'blockstack {i}: type: {block_info.kind.value} '
+                      f'handler: {block_info.handler} '
+                      f'level: {block_info.level}', file=stderr)
 
     def _maybe_box_result_truthy(
             self, result: Optional[Union[bool, Result[bool]]]) -> bool:
-        if result is None:
+        if result is None or result is False:
             return False
-        if isinstance(result, bool):
-            return result
+        if result is True:
+            return True
         assert isinstance(result, Result), result
         r = result.get_value()
         assert isinstance(r, bool)
@@ -1255,8 +1392,177 @@ class StatefulFrame:
         if (echo_dump_code and echo_dump_code in str(self.code)):
             print(self.code, file=sys.stderr)
             dis.dis(self.code)
+
+        # Note: the dispatch loop keeps the frame state it touches on every
+        # instruction in locals; handlers still read and write self.pc.
+        pc_to_step = self.pc_to_step
+        stack = self.stack
+        # Read per run rather than per instruction; echo_vm unsets it around
+        # --preload imports, so it can't be fixed at import time either.
+        dump_insts = os.getenv('ECHO_DUMP_INSTS')
         while True:
-            bc_result = self._run_one_bytecode()
-            if bc_result is None:
-                continue
-            return bc_result
+            step = pc_to_step[self.pc]
+            assert step is not None, (self.pc_to_instruction, self.pc)
+            (instruction, f, f_sets_pc, arg, argval, width, starts_line,
+             stack_effect) = step
+
+            if starts_line is not None:
+                self.current_lineno = starts_line
+                self.line = starts_line
+                log('bc:line',
+                    lambda: f'{self.code.co_filename}:{self.line}')
+
+            log('bc:inst', lambda: str(instruction))
+            if dump_insts:
+                self._dump_inst(instruction, dump_insts)
+
+            if f is None:
+                # Only the frame-exiting opcodes are decoded without a
+                # handler, so ordinary instructions never pay for these
+                # opcode comparisons.
+                if instruction.opcode == _RETURN_VALUE_OPCODE:
+                    v = Value(self._pop())
+                    log('bc:rv', lambda: repr(v))
+                    return Result((v, ReturnKind.RETURN))
+
+                if instruction.opcode == _YIELD_VALUE_OPCODE:
+                    assert width is not None
+                    self.pc += width
+                    return Result((Value(self._peek()), ReturnKind.YIELD))
+
+                # Unimplemented, raise the same error getattr would.
+                f = getattr(StatefulFrame,
+                            '_run_{}'.format(instruction.opname))
+
+            stack_depth_before = len(stack)  # For the stack_effect check.
+            result = f(self, arg, argval)
+            log('bc:res', lambda: f'result {result}')
+            # Most handlers return None (or a jump decision), so test that
+            # by identity before any of the Result handling.
+            if result is None or result is True or result is False:
+                pass
+            else:
+                assert isinstance(result, Result), (
+                    'Bytecode must return Result', instruction, 'got', result)
+                if result.is_exception():
+                    exception_data = result.get_exception()
+                    if not exception_data.traceback:
+                        exception_data.traceback = etraceback.ETraceback(
+                            eframe.EFrame(self), self.pc, self.line)
+                    if self._handle_exception(WhyStatus.EXCEPTION,
+                                              exception_data, _Sentinel):
+                        continue
+                    return result
+                else:
+                    value = result.get_value()
+                    if isinstance(value, Value):
+                        self._push_value(value)
+                    elif not f_sets_pc and value is not NoStackPushSentinel:
+                        self._push(value)
+
+            if __debug__ and stack_effect is not None:
+                stack_depth_after = len(stack)
+                assert stack_depth_after-stack_depth_before == stack_effect, (
+                    instruction, stack_depth_after, stack_depth_before,
+                    stack_effect)
+
+            if not f_sets_pc or not self._maybe_box_result_truthy(result):
+                assert width is not None
+                self.pc += width
+
+
+# StatefulFrame's `_run_<opname>` handler (or None) and whether it is
+# `_sets_pc`, indexed by opcode, so that dispatching an instruction is a list
+# index instead of a getattr on a formatted name.
+_OPCODE_TO_HANDLER: List[Optional[Callable]] = [None] * 256
+_OPCODE_SETS_PC: List[bool] = [False] * 256
+for _opname, _opcode in dis.opmap.items():
+    _handler = getattr(StatefulFrame, '_run_' + _opname, None)
+    _OPCODE_TO_HANDLER[_opcode] = _handler
+    _OPCODE_SETS_PC[_opcode] = getattr(_handler, '_sets_pc', False)
+
+
+# An instruction decoded for dispatch: `(instruction, handler,
+# handler_sets_pc, arg, argval, width, starts_line, stack_effect)`, where width
+# is the distance to the next instruction (None for the last one) and
+# stack_effect is the value-stack depth change to verify (None to skip it).
+# The handler is None for RETURN_VALUE/YIELD_VALUE, which the dispatch loop
+# handles itself, and for opcodes with no `_run_` implementation.
+Step = Tuple[dis.Instruction, Optional[Callable], bool, Any, Any,
+             Optional[int], Optional[int], Optional[int]]
+# Monomorphic inline cache entry for a LOAD_METHOD site on guest instances:
+# `(instance class, EClass.dict_epoch, function)`.
+LoadMethodEntry = Tuple[EClass, int, EFunction]
+DecodedCode = Tuple[List[Optional[dis.Instruction]], List[Optional[int]],
+                    List[Optional[Step]], Dict[int, LoadMethodEntry]]
+
+# Keyed by id() since code object equality ignores the line number table,
+# which the decoded instructions depend on. The value holds a weak reference to
+# the code object whose callback drops the entry when the code object dies,
+# before its id can be reused.
+#
+# Note: not weakref.finalize, which stops running callbacks once its atexit
+# hook has run (and the samples test harness runs atexit hooks per sample).
+_DECODED_CODE: Dict[int, Tuple['weakref.ref[types.CodeType]',
+                               DecodedCode]] = {}
+
+
+# Opcodes whose dis.stack_effect doesn't describe what the handler does to
+# the value stack (not all of them exist on every host version).
+_UNCHECKED_STACK_EFFECT_OPCODES = frozenset(dis.opmap[opname] for opname in (
+    # These opcodes claim a value-stack effect, but we use a different stack
+    # for block info.
+    'SETUP_EXCEPT', 'POP_EXCEPT', 'SETUP_FINALLY', 'END_FINALLY',
+    'SETUP_WITH', 'WITH_CLEANUP_START', 'WITH_CLEANUP_FINISH',
+    'CONTINUE_LOOP',
+    # This op causes the stack_effect call to error.
+    'EXTENDED_ARG', 'BREAK_LOOP',
+    # These ops may or may not pop the stack.
+    'JUMP_IF_FALSE_OR_POP', 'JUMP_IF_TRUE_OR_POP', 'FOR_ITER',
+) if opname in dis.opmap)
+
+
+def _expected_stack_effect(instruction: dis.Instruction) -> Optional[int]:
+    if instruction.opcode in _UNCHECKED_STACK_EFFECT_OPCODES:
+        return None
+    try:
+        return dis.stack_effect(instruction.opcode, instruction.arg)
+    except ValueError:  # Not an opcode this host knows an effect for.
+        return None
+
+
+def decode_code(code: types.CodeType) -> DecodedCode:
+    """Returns `(pc_to_instruction, pc_to_bc_width, pc_to_step,
+    load_method_cache)` for `code`.
+
+    Decoding happens once per code object; the lists are shared by every
+    frame that runs it and must not be mutated. The LOAD_METHOD cache
+    (`{pc: LoadMethodEntry}`) is shared the same way but filled in as the
+    frames run, so it lives as long as the code object does.
+    """
+    cached = _DECODED_CODE.get(id(code))
+    if cached is not None:
+        return cached[1]
+
+    instructions = tuple(dis.get_instructions(code))
+    pc_to_instruction: List[Optional[dis.Instruction]] = \
+        [None] * (instructions[-1].offset+1)
+    pc_to_bc_width: List[Optional[int]] = [None] * (instructions[-1].offset+1)
+    pc_to_step: List[Optional[Step]] = [None] * (instructions[-1].offset+1)
+    for i, instruction in enumerate(instructions):
+        pc_to_instruction[instruction.offset] = instruction
+        if i+1 != len(instructions):
+            pc_to_bc_width[instruction.offset] = (
+                instructions[i+1].offset-instruction.offset)
+        pc_to_step[instruction.offset] = (
+            instruction, _OPCODE_TO_HANDLER[instruction.opcode],
+            _OPCODE_SETS_PC[instruction.opcode], instruction.arg,
+            instruction.argval, pc_to_bc_width[instruction.offset],
+            instruction.starts_line, _expected_stack_effect(instruction))
+
+    decoded: DecodedCode = (
+        pc_to_instruction, pc_to_bc_width, pc_to_step, {})
+    key = id(code)
+    _DECODED_CODE[key] = (
+        weakref.ref(code, lambda _: _DECODED_CODE.pop(key, None)), decoded)
+    return decoded
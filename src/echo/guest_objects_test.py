@@ -1,4 +1,8 @@
-from echo.eobjects import EClass
+import pytest
+
+from echo.eobjects import EClass, EBuiltin, get_guest_builtin
+from echo import builtin_iter
+from echo import epy_object
 
 
 def test_subtype():
@@ -9,3 +13,22 @@ def test_subtype():
     assert base.is_subtype_of(base)
     assert derived.is_subtype_of(base)
     assert not base.is_subtype_of(derived)
+
+
+def test_is_ebuiltin():
+    assert EBuiltin.is_ebuiltin(get_guest_builtin('len'))
+    assert EBuiltin.is_ebuiltin(builtin_iter._do_iter)
+    assert not EBuiltin.is_ebuiltin(len)
+    assert not EBuiltin.is_ebuiltin([])
+
+
+def test_establish_ictx_pops_on_exception():
+    data = ({}, None, object())
+    try:
+        with epy_object.establish_ictx(*data):
+            assert epy_object._find_thread_ictx() == data
+            raise ValueError
+    except ValueError:
+        pass
+    with pytest.raises(epy_object.NoContextException):
+        epy_object._find_thread_ictx()
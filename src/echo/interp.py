@@ -1,10 +1,9 @@
 """(Metacircular) interpreter loop implementation."""
 
-import dis
 import types
 import weakref
 
-from typing import Dict, Any, Text, Tuple, List, Optional
+from typing import Dict, Any, Text, Tuple, Optional
 
 from echo import epy_object
 from echo import builtin_sys_module
@@ -26,7 +25,9 @@ from echo.eobjects import (
 )
 from echo.enative_fn import ENativeFn
 from echo import interp_routines
-from echo.frame_objects import StatefulFrame, UnboundLocalSentinel
+from echo.frame_objects import (
+    StatefulFrame, UnboundLocalSentinel, decode_code,
+)
 from echo.value import Value
 from echo import ebuiltins
 
@@ -125,19 +126,11 @@ def interp(code: types.CodeType,
             local_value = locals_[index]
             cellvars[i].set(local_value)
 
-    instructions = tuple(dis.get_instructions(code))
-    pc_to_instruction: List[Optional[dis.Instruction]] = \
-        [None] * (instructions[-1].offset+1)
-    pc_to_bc_width: List[Optional[int]] = [None] * (instructions[-1].offset+1)
-    for i, instruction in enumerate(instructions):
-        pc_to_instruction[instruction.offset] = instruction
-        if i+1 != len(instructions):
-            pc_to_bc_width[instruction.offset] = (
-                instructions[i+1].offset-instruction.offset)
-    del instructions
-
-    f = StatefulFrame(code, pc_to_instruction, pc_to_bc_width, locals_,
-                      locals_dict, globals_, cellvars, in_function, ictx)
+    (pc_to_instruction, pc_to_bc_width, pc_to_step,
+     load_method_cache) = decode_code(code)
+    f = StatefulFrame(code, pc_to_instruction, pc_to_bc_width, pc_to_step,
+                      load_method_cache, locals_, locals_dict, globals_,
+                      cellvars, in_function, ictx)
 
     if attrs.generator:
         return Result(EGenerator(f))
@@ -9,6 +9,12 @@ T = TypeVar('T')
 
 
 class ExceptionData:
+    # Note: instances are filled in as they propagate (the frame that first
+    # sees an exception attaches its traceback), and the wrapped exception
+    # may be raised natively, so neither may be cached and shared between
+    # failing operations.
+    __slots__ = ('traceback', 'parameter', 'exception')
+
     def __init__(self, traceback, parameter, exception):
         self.traceback = traceback or []
         self.parameter = parameter
@@ -23,6 +29,8 @@ class ExceptionData:
 class Result(Generic[T]):
     """Represents either a value returned from execution or an exception."""
 
+    __slots__ = ('value',)
+
     def __init__(self, value: Union[T, ExceptionData]):
         self.value = value
 
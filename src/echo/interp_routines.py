@@ -129,31 +129,72 @@ def run_unop(opname: Text, arg: Any, ictx: ICtx) -> Result[Any]:
     raise NotImplementedError(opname)
 
 
+# Guest builtins used on the binop/compare paths, resolved once at import.
+_TYPE_BUILTIN = get_guest_builtin('type')
+_ISINSTANCE_BUILTIN = get_guest_builtin('isinstance')
+_STR_BUILTIN = get_guest_builtin('str')
+_INT_BUILTIN = get_guest_builtin('int')
+_LIST_BUILTIN = get_guest_builtin('list')
+_DICT_BUILTIN = get_guest_builtin('dict')
+_BYTEARRAY_BUILTIN = get_guest_builtin('bytearray')
+_SET_BUILTIN = get_guest_builtin('set')
+_DICT_EQ_BUILTIN = get_guest_builtin('dict.__eq__')
+_LIST_EQ_BUILTIN = get_guest_builtin('list.__eq__')
+
+# Guest types whose binary operations run_binop performs natively, and the
+# native types of the values that report those guest types.
+_BINOP_VALUE_TYPES = frozenset((
+    get_guest_builtin('bool'), get_guest_builtin('bytes'),
+    _STR_BUILTIN, _INT_BUILTIN, _LIST_BUILTIN, _DICT_BUILTIN,
+    _BYTEARRAY_BUILTIN, _SET_BUILTIN, get_guest_builtin('tuple'),
+    float, complex, slice, range, type(sys.version_info),
+    collections.OrderedDict,
+))
+_BINOP_NATIVE_VALUE_TYPES = frozenset((
+    bool, bytes, str, int, list, dict, bytearray, set, tuple,
+    float, complex, slice, range, type(sys.version_info),
+    collections.OrderedDict,
+))
+
+
+def make_binop_runner(
+        opname: Text) -> Callable[[Any, Any, ICtx], Result[Any]]:
+    """Returns the binary operation `opname` as `run(lhs, rhs, ictx)`.
+
+    The native operator is resolved here, once. When both operands are native
+    values, their guest types are in _BINOP_VALUE_TYPES, so the operator
+    applies without asking the guest `type` about either of them; anything
+    else goes to run_binop.
+    """
+    op = _BINARY_OPS[opname]
+    checks_zero_divisor = opname in ('BINARY_TRUE_DIVIDE', 'BINARY_MODULO')
+
+    def run(lhs: Any, rhs: Any, ictx: ICtx) -> Result[Any]:
+        if checks_zero_divisor and type(rhs) is int and rhs == 0:
+            raise NotImplementedError(opname, lhs, rhs)
+        if (type(lhs) in _BINOP_NATIVE_VALUE_TYPES
+                and type(rhs) in _BINOP_NATIVE_VALUE_TYPES):
+            return Result(op(lhs, rhs))
+        return run_binop(opname, lhs, rhs, ictx)
+
+    return run
+
+
 @check_result
 def run_binop(opname: Text, lhs: Any, rhs: Any, ictx: ICtx) -> Result[Any]:
-    do_type = get_guest_builtin('type')
+    """Binary operation by guest type; see make_binop_runner for the
+    native-operand case, which callers are expected to have tried."""
+    do_type = _TYPE_BUILTIN
     lhs_type = do_type.invoke((lhs,), {}, {}, ictx).get_value()
     rhs_type = do_type.invoke((rhs,), {}, {}, ictx).get_value()
-    ebool = get_guest_builtin('bool')
-    ebytes = get_guest_builtin('bytes')
-    estr = get_guest_builtin('str')
-    eint = get_guest_builtin('int')
-    elist = get_guest_builtin('list')
-    edict = get_guest_builtin('dict')
-    ebytearray = get_guest_builtin('bytearray')
-    eset = get_guest_builtin('set')
-    etuple = get_guest_builtin('tuple')
-    builtin_value_types = {
-        ebool, ebytes, estr, eint, elist, edict, ebytearray, eset, etuple,
-        float, complex, slice, range, ebytearray, type(sys.version_info),
-        collections.OrderedDict,
-    }
-
-    if (opname in ('BINARY_TRUE_DIVIDE', 'BINARY_MODULO') and rhs_type is eint
-            and rhs == 0):
-        raise NotImplementedError(opname, lhs, rhs)
-
-    if (({lhs_type, rhs_type} <= builtin_value_types) or
+    estr = _STR_BUILTIN
+    eint = _INT_BUILTIN
+    elist = _LIST_BUILTIN
+    edict = _DICT_BUILTIN
+    ebytearray = _BYTEARRAY_BUILTIN
+    eset = _SET_BUILTIN
+
+    if (({lhs_type, rhs_type} <= _BINOP_VALUE_TYPES) or
         (lhs_type in (elist, edict, types.MappingProxyType, ebytearray)
             and opname == 'BINARY_SUBSCR') or
         (lhs_type == rhs_type == elist and opname == 'BINARY_ADD') or
@@ -192,9 +233,8 @@ def exception_match(lhs, rhs, ictx: ICtx) -> Result[Any]:
     if lhs is rhs:
         r = Result(True)
     else:
-        do_isinstance = get_guest_builtin('isinstance')
-        r = do_isinstance.invoke((lhs, rhs), {}, {}, ictx)
-    log('ir:em', f'lhs {lhs!r} rhs {rhs!r} => {r}')
+        r = _ISINSTANCE_BUILTIN.invoke((lhs, rhs), {}, {}, ictx)
+    log('ir:em', lambda: f'lhs {lhs!r} rhs {rhs!r} => {r}')
     return r
 
 
@@ -210,12 +250,10 @@ def compare(opname: Text, lhs, rhs, ictx: ICtx) -> Result[bool]:
         return Result(False)
 
     if isinstance(lhs, dict) and isinstance(rhs, dict) and opname == '==':
-        f = get_guest_builtin('dict.__eq__')
-        return f.invoke((lhs, rhs), {}, {}, ictx)
+        return _DICT_EQ_BUILTIN.invoke((lhs, rhs), {}, {}, ictx)
 
     if isinstance(lhs, list) and isinstance(rhs, list) and opname == '==':
-        f = get_guest_builtin('list.__eq__')
-        return f.invoke((lhs, rhs), {}, {}, ictx)
+        return _LIST_EQ_BUILTIN.invoke((lhs, rhs), {}, {}, ictx)
 
     if opname in ('in', 'not in') and type(rhs) in (
             tuple, list, dict, set, frozenset, type(os.environ),
@@ -341,7 +379,7 @@ def _name_is_from_metaclass(cls: EClass, name: Text) -> bool:
 
 @debugged('ir:mrs')
 def method_requires_self(obj: Any, name: Text, value: Any, ictx: ICtx) -> bool:
-    do_type = get_guest_builtin('type')
+    do_type = _TYPE_BUILTIN
     if not isinstance(do_type, EClass):
         return False
     t = do_type.invoke((obj,), {}, {}, ictx).get_value()